@@ -3,11 +3,34 @@ YouTube 채널 분석 전용 모듈
 채널 정보 수집, 영상 분석, 성과 측정 담당
 """
 
-import re
 import time
+from collections import OrderedDict, defaultdict
 from datetime import datetime, timedelta
+from operator import itemgetter
 from googleapiclient.errors import HttpError
 import config
+from .youtube_client import CHANNEL_ID_PATTERN, CHANNEL_URL_PATTERN
+from utils import parse_duration, SYMBOL_PATTERN
+from utils.cache_manager import load_json_cache, save_json_cache, clear_json_cache
+
+# 선택적 import (설치되지 않은 경우 기본 방식으로 계산)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# 메모리에 보관할 최대 채널 정보 수 (초과 시 가장 오래 사용하지 않은 채널부터 제거)
+CHANNEL_CACHE_MAX_SIZE = 256
+
+# 제목 키워드 추출 시 제외할 불용어
+TITLE_STOP_WORDS = frozenset({'있는', '그는', '그녀', '이것', '저것', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to'})
+
+# 아웃라이어 점수 = (조회수 비율 × 가중치 + 참여율 × 가중치) × 배율, 최대 점수로 제한
+OUTLIER_VIEW_WEIGHT = 0.7
+OUTLIER_ENGAGEMENT_WEIGHT = 0.3
+OUTLIER_SCORE_SCALE = 10
+OUTLIER_SCORE_MAX = 100
 
 class ChannelAnalyzer:
     """YouTube 채널 분석 클래스"""
@@ -20,7 +43,7 @@ class ChannelAnalyzer:
             youtube_client: YouTubeClient 인스턴스
         """
         self.client = youtube_client
-        self.channel_cache = {}  # 채널 정보 캐싱
+        self.channel_cache = OrderedDict()  # 채널 정보 캐싱 (최근 사용 순서의 LRU)
         
     def extract_channel_id_from_url(self, url_or_input):
         """
@@ -34,28 +57,20 @@ class ChannelAnalyzer:
         """
         try:
             # 이미 채널 ID인 경우
-            if re.match(r'^UC[a-zA-Z0-9_-]{22}$', url_or_input):
+            if CHANNEL_ID_PATTERN.match(url_or_input):
                 return url_or_input, None
             
-            # 채널 URL에서 ID 추출
-            patterns = [
-                r'youtube\.com/channel/([UC][a-zA-Z0-9_-]{22})',
-                r'youtube\.com/c/([a-zA-Z0-9_.-]+)',
-                r'youtube\.com/user/([a-zA-Z0-9_.-]+)',
-                r'youtube\.com/@([a-zA-Z0-9_.-]+)',
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, url_or_input)
-                if match:
-                    identifier = match.group(1)
-                    
-                    # UC로 시작하는 경우 채널 ID
-                    if identifier.startswith('UC'):
-                        return identifier, None
-                    else:
-                        # 핸들이나 사용자명인 경우 채널 ID로 변환 필요
-                        return self.resolve_channel_handle(identifier)
+            # 채널 URL에서 ID 추출 (모든 URL 형식을 한 번에 검색)
+            match = CHANNEL_URL_PATTERN.search(url_or_input)
+            if match:
+                identifier = match.group(match.lastgroup)
+                
+                # UC로 시작하는 경우 채널 ID
+                if identifier.startswith('UC'):
+                    return identifier, None
+                else:
+                    # 핸들이나 사용자명인 경우 채널 ID로 변환 필요
+                    return self.resolve_channel_handle(identifier)
             
             # 직접 핸들명인 경우
             return self.resolve_channel_handle(url_or_input)
@@ -66,7 +81,7 @@ class ChannelAnalyzer:
     
     def resolve_channel_handle(self, handle):
         """
-        채널 핸들을 채널 ID로 변환
+        채널 핸들을 채널 ID로 변환 (캐시/조회/검색은 YouTubeClient.resolve_channel_identifier에 위임)
         
         Args:
             handle (str): 채널 핸들 또는 사용자명
@@ -74,40 +89,7 @@ class ChannelAnalyzer:
         Returns:
             tuple: (channel_id, handle)
         """
-        try:
-            print(f"🔍 채널 검색 중: '{handle}'")
-            
-            # 채널 검색
-            channels = self.client.search_channels(handle, max_results=10)
-            
-            if not channels:
-                print(f"❌ '{handle}' 채널을 찾을 수 없습니다.")
-                return None, handle
-            
-            # 가장 일치하는 채널 찾기
-            for channel in channels:
-                channel_title = channel['snippet']['title'].lower()
-                channel_id = channel['id']['channelId']
-                
-                # 정확한 일치 또는 유사한 일치 확인
-                if (handle.lower() == channel_title or 
-                    handle.lower() in channel_title or 
-                    channel_title in handle.lower()):
-                    
-                    print(f"✅ 채널 발견: {channel['snippet']['title']} (ID: {channel_id})")
-                    return channel_id, handle
-            
-            # 첫 번째 결과 사용
-            first_channel = channels[0]
-            channel_id = first_channel['id']['channelId']
-            channel_title = first_channel['snippet']['title']
-            
-            print(f"⚠️ 정확한 일치를 찾지 못했습니다. 첫 번째 결과 사용: {channel_title}")
-            return channel_id, handle
-            
-        except Exception as e:
-            print(f"채널 핸들 변환 오류: {e}")
-            return None, handle
+        return self.client.resolve_channel_identifier(handle, use_first_result=True), handle
     
     def analyze_channel(self, channel_id, max_videos=50, detailed=True):
         """
@@ -167,24 +149,45 @@ class ChannelAnalyzer:
     
     def get_channel_info(self, channel_id):
         """캐시를 사용한 채널 정보 가져오기"""
+        cache_seconds = config.CACHE_DURATION_MINUTES * 60
+        
         # 캐시 확인
         if config.ENABLE_CHANNEL_CACHE and channel_id in self.channel_cache:
             cache_time, cached_info = self.channel_cache[channel_id]
             
             # 캐시가 유효한지 확인 (30분)
-            if (datetime.now() - cache_time).seconds < config.CACHE_DURATION_MINUTES * 60:
+            if (datetime.now() - cache_time).total_seconds() < cache_seconds:
+                self.channel_cache.move_to_end(channel_id)
                 print(f"📋 캐시에서 채널 정보 로드: {cached_info['snippet']['title']}")
                 return cached_info
         
+        # 디스크 캐시 확인 (이전 실행에서 가져온 정보)
+        if config.ENABLE_CHANNEL_CACHE:
+            cached_info = load_json_cache('channel_info', channel_id, cache_seconds)
+            if cached_info:
+                self._store_channel_info(channel_id, cached_info)
+                print(f"📋 디스크 캐시에서 채널 정보 로드: {cached_info['snippet']['title']}")
+                return cached_info
+        
         # 새로 가져오기
         channel_info = self.client.get_channel_info(channel_id)
         
         # 캐시에 저장
         if config.ENABLE_CHANNEL_CACHE and channel_info:
-            self.channel_cache[channel_id] = (datetime.now(), channel_info)
+            self._store_channel_info(channel_id, channel_info)
+            save_json_cache('channel_info', channel_id, channel_info)
         
         return channel_info
     
+    def _store_channel_info(self, channel_id, channel_info):
+        """채널 정보를 메모리 캐시에 저장 (최대 크기를 넘으면 가장 오래된 항목 제거)"""
+        cache = self.channel_cache
+        cache[channel_id] = (datetime.now(), channel_info)
+        cache.move_to_end(channel_id)
+        
+        while len(cache) > CHANNEL_CACHE_MAX_SIZE:
+            cache.popitem(last=False)
+    
     def get_channel_videos(self, channel_id, max_results=50, order='date'):
         """
         채널의 영상 목록 가져오기
@@ -246,6 +249,7 @@ class ChannelAnalyzer:
             video_metrics = []
             all_keywords = []
             upload_dates = []
+            analyzed = []  # (영상, 조회수, 참여율) - 평균 조회수를 구한 뒤 아웃라이어 점수 계산용
             
             for i, video in enumerate(videos):
                 try:
@@ -265,8 +269,7 @@ class ChannelAnalyzer:
                     engagement_rate = ((likes + comments) / views * 100) if views > 0 else 0
                     
                     # 영상 유형 분류
-                    duration = video.get('parsed_duration', '00:00')
-                    is_shorts = self.is_shorts_video(duration)
+                    is_shorts = self.is_shorts(video)
                     video_type = 'shorts' if is_shorts else 'long'
                     analysis['video_types'][video_type] += 1
                     
@@ -280,7 +283,7 @@ class ChannelAnalyzer:
                         'engagement_rate': engagement_rate,
                         'type': video_type,
                         'published_at': snippet['publishedAt'],
-                        'duration': duration
+                        'duration': video.get('parsed_duration', '00:00')
                     }
                     video_metrics.append(video_metric)
                     
@@ -293,18 +296,22 @@ class ChannelAnalyzer:
                         title_keywords = self.extract_keywords_from_title(snippet['title'])
                         all_keywords.extend(title_keywords)
                     
-                    # 영상에 분석 결과 추가
+                    # 영상에 분석 결과 추가 (아웃라이어 점수는 전체 평균이 나온 뒤 계산)
                     video['analysis'] = {
                         'rank': i + 1,
                         'engagement_rate': engagement_rate,
-                        'outlier_score': self.calculate_outlier_score(views, engagement_rate, analysis['total_views'], len(videos)),
+                        'outlier_score': 0,
                         'video_type': video_type
                     }
+                    analyzed.append((video, views, engagement_rate))
                     
                 except Exception as e:
                     print(f"영상 분석 오류 (ID: {video.get('id', 'Unknown')}): {e}")
                     continue
             
+            # 누적 중인 합계가 아니라 전체 평균 조회수 기준으로 아웃라이어 점수 계산
+            self.assign_outlier_scores(analyzed)
+            
             # 평균 계산
             if len(videos) > 0:
                 analysis['avg_views'] = analysis['total_views'] // len(videos)
@@ -315,7 +322,7 @@ class ChannelAnalyzer:
                 analysis['avg_engagement_rate'] = avg_engagement
             
             # 상위/하위 성과 영상 (상위/하위 5개)
-            video_metrics.sort(key=lambda x: x['views'], reverse=True)
+            video_metrics.sort(key=itemgetter('views'), reverse=True)
             analysis['top_performers'] = video_metrics[:5]
             analysis['worst_performers'] = video_metrics[-5:] if len(video_metrics) >= 5 else []
             
@@ -401,8 +408,8 @@ class ChannelAnalyzer:
             dict: 트렌드 분석 결과
         """
         try:
-            # 시간별 성과 분석
-            monthly_performance = {}
+            # 시간별 성과 분석 (월이 처음 나오면 빈 집계를 자동 생성)
+            monthly_performance = defaultdict(lambda: {'views': 0, 'videos': 0, 'shorts': 0, 'long': 0})
             video_types_trend = {'shorts': [], 'long': []}
             
             for video in videos:
@@ -411,17 +418,12 @@ class ChannelAnalyzer:
                     month_key = published_at[:7]  # YYYY-MM
                     
                     views = int(video['statistics'].get('viewCount', 0))
-                    duration = video.get('parsed_duration', '00:00')
-                    video_type = 'shorts' if self.is_shorts_video(duration) else 'long'
-                    
-                    if month_key not in monthly_performance:
-                        monthly_performance[month_key] = {
-                            'views': 0, 'videos': 0, 'shorts': 0, 'long': 0
-                        }
+                    video_type = 'shorts' if self.is_shorts(video) else 'long'
                     
-                    monthly_performance[month_key]['views'] += views
-                    monthly_performance[month_key]['videos'] += 1
-                    monthly_performance[month_key][video_type] += 1
+                    month = monthly_performance[month_key]
+                    month['views'] += views
+                    month['videos'] += 1
+                    month[video_type] += 1
                     
                     video_types_trend[video_type].append({
                         'date': published_at[:10],
@@ -432,6 +434,9 @@ class ChannelAnalyzer:
                     print(f"트렌드 분석 중 영상 처리 오류: {e}")
                     continue
             
+            # 이후 조회에서 빈 항목이 생기지 않도록 일반 dict로 변환
+            monthly_performance = dict(monthly_performance)
+            
             # 트렌드 방향 계산
             trend_direction = self.calculate_trend_direction(monthly_performance)
             
@@ -451,23 +456,22 @@ class ChannelAnalyzer:
             return {}
     
     # 유틸리티 메서드들
+    def is_shorts(self, video):
+        """영상 데이터로 쇼츠 여부 판단 (초 단위 길이가 있으면 문자열을 다시 파싱하지 않음)"""
+        duration_seconds = video.get('duration_seconds')
+        if duration_seconds is None:
+            return self.is_shorts_video(video.get('parsed_duration', '00:00'))
+        
+        return duration_seconds <= config.SHORT_VIDEO_MAX_DURATION
+    
     def is_shorts_video(self, duration_str):
         """영상이 쇼츠인지 판단"""
         try:
             if ':' not in duration_str:
                 return False
             
-            parts = duration_str.split(':')
-            if len(parts) == 2:  # MM:SS
-                minutes, seconds = map(int, parts)
-                total_seconds = minutes * 60 + seconds
-            elif len(parts) == 3:  # HH:MM:SS
-                hours, minutes, seconds = map(int, parts)
-                total_seconds = hours * 3600 + minutes * 60 + seconds
-            else:
-                return False
-            
-            return total_seconds <= config.SHORT_VIDEO_MAX_DURATION
+            # MM:SS / HH:MM:SS 파싱 결과는 캐시됨
+            return parse_duration(duration_str) <= config.SHORT_VIDEO_MAX_DURATION
             
         except Exception:
             return False
@@ -476,15 +480,12 @@ class ChannelAnalyzer:
         """제목에서 키워드 추출"""
         try:
             # 간단한 키워드 추출 (한글, 영문)
-            import re
+            # 특수문자 제거 및 단어 분리 (split() 결과는 이미 공백이 없음)
+            clean_title = SYMBOL_PATTERN.sub(' ', title)
+            words = [word for word in clean_title.split() if len(word) >= 2]
             
-            # 특수문자 제거 및 단어 분리
-            clean_title = re.sub(r'[^\w\s가-힣]', ' ', title)
-            words = [word.strip() for word in clean_title.split() if len(word.strip()) >= 2]
-            
-            # 불용어 제거 (간단한 리스트)
-            stop_words = {'있는', '그는', '그녀', '이것', '저것', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to'}
-            keywords = [word for word in words if word.lower() not in stop_words]
+            # 불용어 제거
+            keywords = [word for word in words if word.lower() not in TITLE_STOP_WORDS]
             
             return keywords[:5]  # 상위 5개만
             
@@ -492,15 +493,48 @@ class ChannelAnalyzer:
             print(f"키워드 추출 오류: {e}")
             return []
     
+    def assign_outlier_scores(self, analyzed):
+        """
+        분석된 영상들의 아웃라이어 점수를 한 번에 계산해 video['analysis']에 기록
+        
+        Args:
+            analyzed (list): (영상, 조회수, 참여율) 목록
+        """
+        if not analyzed:
+            return
+        
+        videos, views, engagement_rates = zip(*analyzed)
+        
+        if NUMPY_AVAILABLE:
+            views = np.asarray(views, dtype=np.float64)
+            engagement_rates = np.asarray(engagement_rates, dtype=np.float64)
+            
+            # 평균 조회수가 0이면 (모든 영상 조회수 0) 비율을 1로 봄 - calculate_outlier_score와 동일
+            avg_views = views.mean()
+            view_ratios = views / avg_views if avg_views > 0 else np.ones_like(views)
+            scores = np.minimum(
+                (view_ratios * OUTLIER_VIEW_WEIGHT + engagement_rates * OUTLIER_ENGAGEMENT_WEIGHT) * OUTLIER_SCORE_SCALE,
+                OUTLIER_SCORE_MAX
+            ).tolist()
+        else:
+            total_views = sum(views)
+            scores = [
+                self.calculate_outlier_score(view_count, rate, total_views, len(views))
+                for view_count, rate in zip(views, engagement_rates)
+            ]
+        
+        for video, score in zip(videos, scores):
+            video['analysis']['outlier_score'] = score
+    
     def calculate_outlier_score(self, views, engagement_rate, total_views, video_count):
         """아웃라이어 점수 계산"""
         try:
-            avg_views = total_views / video_count if video_count > 0 else 1
-            view_ratio = views / avg_views if avg_views > 0 else 1
+            avg_views = total_views / video_count if video_count > 0 else 0
+            view_ratio = views / avg_views if avg_views > 0 else 1.0
             
             # 조회수 비율과 참여도를 조합한 점수
-            outlier_score = (view_ratio * 0.7 + engagement_rate * 0.3) * 10
-            return min(outlier_score, 100)  # 최대 100점
+            outlier_score = (view_ratio * OUTLIER_VIEW_WEIGHT + engagement_rate * OUTLIER_ENGAGEMENT_WEIGHT) * OUTLIER_SCORE_SCALE
+            return min(outlier_score, OUTLIER_SCORE_MAX)
             
         except Exception:
             return 0
@@ -689,9 +723,8 @@ class ChannelAnalyzer:
             
             for video in videos:
                 views = int(video['statistics'].get('viewCount', 0))
-                duration = video.get('parsed_duration', '00:00')
                 
-                if self.is_shorts_video(duration):
+                if self.is_shorts(video):
                     shorts_performance.append(views)
                 else:
                     long_performance.append(views)
@@ -720,6 +753,7 @@ class ChannelAnalyzer:
     def clear_cache(self):
         """캐시 정리"""
         self.channel_cache.clear()
+        clear_json_cache('channel_info')
         print("🧹 채널 분석 캐시가 정리되었습니다.")
     
     def get_cache_info(self):
@@ -4,8 +4,10 @@ YouTube 트렌드 분석 전용 모듈
 """
 
 import re
+import heapq
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta
+from utils import SYMBOL_PATTERN
 
 # 선택적 import (설치되지 않은 경우 기본 기능으로 대체)
 try:
@@ -14,6 +16,11 @@ try:
 except ImportError:
     KONLPY_AVAILABLE = False
 
+# 키워드 추출 시 제외할 불용어 (한국어 명사 / 영어 단어)
+KOREAN_STOPWORDS = frozenset({'것', '수', '내', '거', '때문', '위해', '통해', '따라', '대해', '에서', '으로', '에게'})
+ENGLISH_STOPWORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'})
+
+
 class TrendAnalyzer:
     """YouTube 트렌드 분석 클래스"""
     
@@ -170,7 +177,7 @@ class TrendAnalyzer:
             return []
         
         # 특수문자 제거
-        clean_text = re.sub(r'[^\w\s가-힣]', ' ', text)
+        clean_text = SYMBOL_PATTERN.sub(' ', text)
         
         if self.language == "ko" and self.okt:
             # 한국어 키워드 추출
@@ -179,8 +186,7 @@ class TrendAnalyzer:
                 keywords = [word for word in nouns if len(word) >= 2]
                 
                 # 불용어 제거
-                stopwords = {'것', '수', '내', '거', '때문', '위해', '통해', '따라', '대해', '에서', '으로', '에게'}
-                keywords = [word for word in keywords if word not in stopwords]
+                keywords = [word for word in keywords if word not in KOREAN_STOPWORDS]
                 
                 return keywords[:10]  # 상위 10개
             except:
@@ -188,15 +194,14 @@ class TrendAnalyzer:
         
         # 영어 또는 한국어 처리 실패 시
         words = clean_text.lower().split()
-        stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        keywords = [word for word in words if len(word) > 2 and word not in stopwords]
+        keywords = [word for word in words if len(word) > 2 and word not in ENGLISH_STOPWORDS]
         
         return keywords[:10]
     
     def _clean_keyword(self, keyword):
         """키워드 정제"""
         # 소문자 변환, 특수문자 제거
-        keyword = re.sub(r'[^\w\s가-힣]', '', keyword.lower())
+        keyword = SYMBOL_PATTERN.sub('', keyword.lower())
         return keyword.strip()
     
     def _calculate_trend_scores(self, keyword_stats):
@@ -269,8 +274,7 @@ class TrendAnalyzer:
         related_keywords = {}
         for keyword in keyword_stats.keys():
             if keyword in keyword_cooccurrence:
-                related = sorted(keyword_cooccurrence[keyword].items(), 
-                               key=lambda x: x[1], reverse=True)[:5]
+                related = heapq.nlargest(5, keyword_cooccurrence[keyword].items(), key=lambda x: x[1])
                 
                 related_keywords[keyword] = [
                     {
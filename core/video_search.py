@@ -4,10 +4,21 @@ YouTube 영상 검색 전용 모듈
 """
 
 import time
-import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from datetime import datetime, timedelta
 from googleapiclient.errors import HttpError
 import config
+from .youtube_client import format_duration_text
+from utils import parse_duration_seconds
+from utils.cache_manager import load_json_cache, save_json_cache
+
+# 채널 구독자 수 디스크 캐시 유효 시간 (24시간)
+SUBSCRIBER_CACHE_TTL = 24 * 60 * 60
+
+# 구독자 수 캐시에 보관할 최대 채널 수 (초과 시 가장 오래 사용하지 않은 채널부터 제거)
+SUBSCRIBER_CACHE_MAX_SIZE = 2048
 
 class VideoSearcher:
     """YouTube 영상 검색 클래스"""
@@ -21,8 +32,15 @@ class VideoSearcher:
         """
         self.client = youtube_client
         
+        # 채널 ID -> [구독자 수, 저장 시각] (실행 간 유지, 최근 사용 순서의 LRU)
+        self.channel_cache = OrderedDict(
+            load_json_cache('channels', 'subscriber_counts', SUBSCRIBER_CACHE_TTL) or {}
+        )
+        self._channel_cache_updated = False
+        self._failed_channels = set()
+        
     def search_by_keyword(self, keyword, region_code="KR", max_results=200, 
-                         period_days=30, order="relevance"):
+                         period_days=30, order="relevance", should_stop=None):
         """
         키워드로 영상 검색
         
@@ -32,6 +50,7 @@ class VideoSearcher:
             max_results (int): 최대 결과 수
             period_days (int): 검색 기간 (일)
             order (str): 정렬 기준 ("relevance", "date", "viewCount")
+            should_stop (callable): True를 반환하면 다음 검색 페이지를 요청하지 않음
             
         Returns:
             list: 검색된 영상 목록
@@ -53,17 +72,28 @@ class VideoSearcher:
             # 3. 검색 기간 설정
             published_after = (datetime.now() - timedelta(days=period_days)).isoformat() + 'Z'
             
-            # 4. 영상 검색 실행
-            video_ids = self._execute_search(keyword, region_code, published_after, order, max_results)
-            
-            if not video_ids:
-                print(f"❌ '{keyword}' 키워드로 영상을 찾을 수 없습니다.")
-                self._print_search_suggestions(keyword, period_days)
-                return []
-            
-            # 5. 영상 상세 정보 가져오기
-            print("📊 영상 상세 정보 수집 중...")
-            videos = self.client.get_video_details(video_ids)
+            # 4-5. 영상 검색 실행 + 상세 정보 가져오기
+            # 검색 페이지가 도착하는 대로 상세 정보를 요청해 다음 페이지 검색과 겹쳐 실행
+            with ThreadPoolExecutor(max_workers=1) as details_executor:
+                detail_futures = []
+                
+                def fetch_details(page_ids):
+                    detail_futures.append(details_executor.submit(self.client.get_video_details, page_ids))
+                
+                video_ids = self._execute_search(
+                    keyword, region_code, published_after, order, max_results,
+                    on_page=fetch_details, should_stop=should_stop
+                )
+                
+                if not video_ids:
+                    print(f"❌ '{keyword}' 키워드로 영상을 찾을 수 없습니다.")
+                    self._print_search_suggestions(keyword, period_days)
+                    return []
+                
+                print("📊 영상 상세 정보 수집 중...")
+                videos = []
+                for future in detail_futures:
+                    videos.extend(future.result())
             
             if not videos:
                 print("❌ 영상 상세 정보를 가져올 수 없습니다.")
@@ -76,14 +106,19 @@ class VideoSearcher:
             print(f"❌ 검색 오류: {e}")
             return []
     
-    def _execute_search(self, keyword, region_code, published_after, order, max_results):
-        """실제 검색 실행"""
+    def _execute_search(self, keyword, region_code, published_after, order, max_results,
+                        on_page=None, should_stop=None):
+        """실제 검색 실행 (on_page가 있으면 페이지마다 영상 ID 목록을 전달, should_stop이 True면 중단)"""
         try:
             video_ids = []
             page_token = None
             batch_size = 50  # API 제한
             
             while len(video_ids) < max_results:
+                if should_stop and should_stop():
+                    print("🛑 검색 중지됨")
+                    return []
+                
                 request = self.client.youtube.search().list(
                     part='id',
                     q=keyword,
@@ -101,6 +136,9 @@ class VideoSearcher:
                 batch_ids = [item['id']['videoId'] for item in response.get('items', [])]
                 video_ids.extend(batch_ids)
                 
+                if on_page and batch_ids:
+                    on_page(batch_ids)
+                
                 # 다음 페이지 토큰
                 page_token = response.get('nextPageToken')
                 if not page_token:
@@ -153,8 +191,10 @@ class VideoSearcher:
                     invalid_count += 1
                     continue
                 
-                # 길이를 초 단위로 변환
-                duration_seconds = self._parse_duration_to_seconds(duration)
+                # 길이를 초 단위로 변환 (상세 정보 조회 시 계산된 값 우선 사용)
+                duration_seconds = video.get('duration_seconds')
+                if duration_seconds is None:
+                    duration_seconds = self._parse_duration_to_seconds(duration)
                 
                 # 유형 분류 (60초 기준)
                 is_shorts = duration_seconds <= config.SHORT_VIDEO_MAX_DURATION
@@ -196,45 +236,55 @@ class VideoSearcher:
         print("🔧 지표 필터링 적용 중...")
         
         filtered_videos = []
-        channel_cache = {}
+        self._channel_cache_updated = False
         skipped_view_count = 0
         skipped_subscriber_count = 0
         
-        for i, video in enumerate(videos, 1):
-            print(f"   필터링 진행: {i}/{len(videos)}", end='\r')
+        # 조회수 필터는 한 번의 리스트 컴프리헨션으로 먼저 적용
+        # (탈락한 영상의 채널은 구독자 수를 조회하지 않음)
+        if min_view_count:
+            view_count = self._view_count
+            total_before = len(videos)
+            videos = [video for video in videos if view_count(video) >= min_view_count]
+            skipped_view_count = total_before - len(videos)
+        
+        if not max_subscriber_count:
+            filtered_videos = videos
+        
+        elif videos:
+            # 캐시에 없는 채널의 구독자 수는 반복 전에 일괄 조회 (채널마다 요청하지 않음)
+            self._prefetch_subscriber_counts(
+                video['snippet']['channelId'] for video in videos
+                if 'channelId' in video.get('snippet', {})
+            )
             
-            try:
-                # 조회수 필터 체크
-                if min_view_count:
-                    video_views = int(video['statistics'].get('viewCount', 0))
-                    if video_views < min_view_count:
-                        skipped_view_count += 1
-                        continue
+            for i, video in enumerate(videos, 1):
+                print(f"   필터링 진행: {i}/{len(videos)}", end='\r')
                 
-                # 구독자 수 필터 체크
-                if max_subscriber_count:
+                try:
+                    # 구독자 수 필터 체크
                     channel_id = video['snippet']['channelId']
                     
-                    # 캐시에서 구독자 수 확인
-                    if channel_id not in channel_cache:
-                        channel_info = self.client.get_channel_info(channel_id)
-                        if channel_info:
-                            subscriber_count = int(channel_info['statistics'].get('subscriberCount', 0))
-                            channel_cache[channel_id] = subscriber_count
-                        else:
-                            channel_cache[channel_id] = 0
-                    
-                    channel_subscribers = channel_cache[channel_id]
+                    channel_subscribers = self._get_subscriber_count(channel_id)
                     if channel_subscribers > max_subscriber_count:
                         skipped_subscriber_count += 1
                         continue
-                
-                # 모든 필터 통과
-                filtered_videos.append(video)
-                
-            except Exception as e:
-                print(f"\n❌ 영상 처리 오류 (ID: {video.get('id', 'Unknown')}): {e}")
-                continue
+                    
+                    # 모든 필터 통과
+                    filtered_videos.append(video)
+                    
+                except Exception as e:
+                    print(f"\n❌ 영상 처리 오류 (ID: {video.get('id', 'Unknown')}): {e}")
+                    continue
+        
+        # 새로 조회한 채널이 있으면 디스크 캐시 갱신 (만료 항목 제외)
+        if self._channel_cache_updated:
+            now = time.time()
+            self.channel_cache = OrderedDict(
+                (channel_id, entry) for channel_id, entry in self.channel_cache.items()
+                if now - entry[1] < SUBSCRIBER_CACHE_TTL
+            )
+            save_json_cache('channels', 'subscriber_counts', self.channel_cache)
         
         print(f"\n✅ 지표 필터링 완료:")
         print(f"   조회수 필터로 제외: {skipped_view_count}개")
@@ -243,6 +293,75 @@ class VideoSearcher:
         
         return filtered_videos
     
+    def _view_count(self, video):
+        """영상 조회수 (누락/오류 시 0)"""
+        try:
+            return int(video['statistics'].get('viewCount', 0))
+        except (KeyError, TypeError, ValueError):
+            return 0
+    
+    def _prefetch_subscriber_counts(self, channel_ids):
+        """캐시에 없거나 만료된 채널들의 구독자 수를 일괄 조회해 캐시에 저장"""
+        now = time.time()
+        missing = []
+        seen = set()
+        
+        for channel_id in channel_ids:
+            if channel_id in seen or channel_id in self._failed_channels:
+                continue
+            seen.add(channel_id)
+            
+            cached = self.channel_cache.get(channel_id)
+            if not cached or now - cached[1] >= SUBSCRIBER_CACHE_TTL:
+                missing.append(channel_id)
+        
+        if not missing:
+            return
+        
+        statistics = self.client.get_channels_statistics(missing)
+        
+        for channel_id in missing:
+            if channel_id not in statistics:
+                # 요청하지 못한 채널은 이후 개별 조회에 맡김
+                continue
+            
+            stats = statistics[channel_id]
+            if stats is None:
+                # 성공한 응답에 없는 채널은 개별 조회해도 실패하므로 다시 요청하지 않음
+                self._failed_channels.add(channel_id)
+                continue
+            self._store_subscriber_count(channel_id, int(stats.get('subscriberCount', 0)), now)
+    
+    def _store_subscriber_count(self, channel_id, subscriber_count, timestamp):
+        """구독자 수를 캐시에 저장 (최대 크기를 넘으면 가장 오래된 항목 제거)"""
+        cache = self.channel_cache
+        cache[channel_id] = [subscriber_count, timestamp]
+        cache.move_to_end(channel_id)
+        
+        while len(cache) > SUBSCRIBER_CACHE_MAX_SIZE:
+            cache.popitem(last=False)
+        
+        self._channel_cache_updated = True
+    
+    def _get_subscriber_count(self, channel_id):
+        """채널 구독자 수 조회 (캐시 우선, 만료되었거나 없으면 API 호출)"""
+        cached = self.channel_cache.get(channel_id)
+        if cached and time.time() - cached[1] < SUBSCRIBER_CACHE_TTL:
+            self.channel_cache.move_to_end(channel_id)
+            return cached[0]
+        
+        if channel_id in self._failed_channels:
+            return 0
+        
+        channel_info = self.client.get_channel_info(channel_id)
+        if not channel_info:
+            self._failed_channels.add(channel_id)
+            return 0
+        
+        subscriber_count = int(channel_info['statistics'].get('subscriberCount', 0))
+        self._store_subscriber_count(channel_id, subscriber_count, time.time())
+        return subscriber_count
+    
     def sort_videos(self, videos, sort_by="relevance"):
         """
         영상 정렬
@@ -254,21 +373,23 @@ class VideoSearcher:
         Returns:
             list: 정렬된 영상 목록
         """
+        # view_count / published_at은 YouTubeClient.get_video_details에서 미리 계산됨
         if sort_by == "viewCount":
-            videos.sort(key=lambda x: int(x['statistics'].get('viewCount', 0)), reverse=True)
+            videos.sort(key=itemgetter('view_count'), reverse=True)
         elif sort_by == "date":
-            videos.sort(key=lambda x: x['snippet']['publishedAt'], reverse=True)
+            videos.sort(key=itemgetter('published_at'), reverse=True)
         # relevance는 API가 이미 정렬한 상태
         
         return videos
     
-    def search_with_filters(self, keyword, filters):
+    def search_with_filters(self, keyword, filters, should_stop=None):
         """
         필터를 적용한 통합 검색
         
         Args:
             keyword (str): 검색 키워드
             filters (dict): 필터 설정
+            should_stop (callable): True를 반환하면 남은 단계를 건너뛰고 빈 목록 반환
             
         Returns:
             list: 필터링된 영상 목록
@@ -279,10 +400,12 @@ class VideoSearcher:
             region_code=filters.get('region_code', 'KR'),
             max_results=filters.get('max_results', 200),
             period_days=filters.get('period_days', 30),
-            order=filters.get('order', 'relevance')
+            order=filters.get('order', 'relevance'),
+            should_stop=should_stop
         )
         
-        if not videos:
+        # 중지된 경우 구독자 수 조회 등 추가 API 요청을 하지 않음
+        if not videos or (should_stop and should_stop()):
             return []
         
         # 2. 영상 유형 필터링
@@ -311,52 +434,19 @@ class VideoSearcher:
         return videos[:filters.get('max_results', 200)]
     
     def parse_duration(self, duration):
-        """YouTube 영상 길이 파싱 (PT1H2M3S -> 1:02:03)"""
+        """YouTube 영상 길이 파싱 (PT1H2M3S -> 1:02:03, 결과 캐시)"""
         if not duration:
             return "00:00"
         
-        try:
-            # PT1H2M3S 형태의 duration 파싱
-            pattern = r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?'
-            match = re.match(pattern, duration)
-            
-            if not match:
-                return "00:00"
-            
-            hours = int(match.group(1) or 0)
-            minutes = int(match.group(2) or 0)
-            seconds = int(match.group(3) or 0)
-            
-            if hours > 0:
-                return f"{hours}:{minutes:02d}:{seconds:02d}"
-            else:
-                return f"{minutes}:{seconds:02d}"
-                
-        except Exception as e:
-            print(f"영상 길이 파싱 오류: {e}")
-            return "00:00"
+        return format_duration_text(duration)
     
     def _parse_duration_to_seconds(self, duration):
         """YouTube duration을 초 단위로 변환"""
         if not duration:
             return 0
         
-        try:
-            pattern = r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?'
-            match = re.match(pattern, duration)
-            
-            if not match:
-                return 0
-            
-            hours = int(match.group(1) or 0)
-            minutes = int(match.group(2) or 0)
-            seconds = int(match.group(3) or 0)
-            
-            return hours * 3600 + minutes * 60 + seconds
-            
-        except Exception as e:
-            print(f"Duration 파싱 오류: {e}")
-            return 0
+        # 모듈 수준에서 컴파일/캐시된 파서 사용 (형식이 맞지 않으면 None이므로 예외 처리 불필요)
+        return parse_duration_seconds(duration) or 0
     
     def _validate_search_parameters(self, keyword, region_code, period_days):
         """검색 파라미터 유효성 검사"""
@@ -437,6 +527,7 @@ class TrendingVideoSearcher(VideoSearcher):
             for video in videos:
                 duration = video.get('contentDetails', {}).get('duration', '')
                 video['parsed_duration'] = self.parse_duration(duration)
+                video['duration_seconds'] = parse_duration_seconds(duration) or 0
             
             self.client.quota_used += 1
             
@@ -509,6 +600,7 @@ class YouTubeClientExtension:
                     # 영상 길이 파싱
                     duration = video.get('contentDetails', {}).get('duration', '')
                     video['parsed_duration'] = self.parse_duration(duration)
+                    video['duration_seconds'] = parse_duration_seconds(duration) or 0
                     
                     all_videos.append(video)
                 
@@ -522,5 +614,4 @@ class YouTubeClientExtension:
     
     def parse_duration(self, duration):
         """YouTube 영상 길이 파싱"""
-        searcher = VideoSearcher(self)
-        return searcher.parse_duration(duration)
\ No newline at end of file
+        return format_duration_text(duration)
\ No newline at end of file
@@ -5,10 +5,66 @@ YouTube Data API v3와의 연동을 담당
 
 import re
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+from googleapiclient.model import JsonModel
 import config
 
+# 선택적 import (orjson이 있으면 API 응답 JSON 파싱에 사용)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+from utils import parse_duration_seconds, format_seconds
+from utils.cache_manager import load_json_cache, save_json_cache
+
+# 핸들/사용자명 -> 채널 ID 변환 결과 디스크 캐시 유효 시간 (7일, 변환에 검색 100유닛 소모)
+CHANNEL_HANDLE_CACHE_TTL = 7 * 24 * 60 * 60
+
+# 채널 ID 자체 (UC + 22자)
+CHANNEL_ID_PATTERN = re.compile(r'^UC[a-zA-Z0-9_-]{22}$')
+
+# 채널 URL 형식 (/channel/ID, /c/이름, /user/이름, /@핸들)을 한 번의 검색으로 확인
+CHANNEL_URL_PATTERN = re.compile(
+    r'youtube\.com/(?:'
+    r'channel/(?P<channel_id>UC[a-zA-Z0-9_-]{22})'
+    r'|c/(?P<custom>[a-zA-Z0-9_.-]+)'
+    r'|user/(?P<user>[a-zA-Z0-9_.-]+)'
+    r'|@(?P<handle>[a-zA-Z0-9_.-]+))'
+)
+
+# videos.list / channels.list 배치(50개)를 동시에 요청할 최대 스레드 수
+VIDEO_DETAILS_WORKERS = 8
+
+# 한 번의 videos.list / channels.list 요청에 넣을 수 있는 최대 ID 수 (API 제한)
+API_BATCH_SIZE = 50
+
+# 채널 ID만 찾을 때 search.list 응답에서 받을 필드 (썸네일/설명 제외로 응답 크기 축소)
+CHANNEL_ID_SEARCH_FIELDS = 'items(id/channelId,snippet/title)'
+
+class OrjsonModel(JsonModel):
+    """API 응답 본문을 orjson으로 파싱하는 응답 모델 (표준 json 모듈보다 빠름)"""
+    
+    def deserialize(self, content):
+        """응답 본문(bytes/str)을 dict로 변환"""
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # 표준 JsonModel과 같은 방식으로 처리 (잘못된 응답이면 그대로 예외 발생)
+            return super().deserialize(content)
+        
+        if self._data_wrapper and 'data' in body:
+            body = body['data']
+        return body
+
 class YouTubeClient:
     """YouTube API 클라이언트"""
     
@@ -23,11 +79,18 @@ class YouTubeClient:
         self.quota_used = 0
         self.quota_limit = config.API_QUOTA_LIMIT
         
+        # 썸네일 등 API 외 HTTP 요청용 공유 세션 (연결 재사용)
+        self.session = create_http_session()
+        
+        # httplib2.Http는 스레드 간 공유할 수 없으므로 병렬 요청은 스레드별 인스턴스 사용
+        self._thread_local = threading.local()
+        
         try:
             self.youtube = build(
                 config.YOUTUBE_API_SERVICE_NAME,
                 config.YOUTUBE_API_VERSION,
-                developerKey=api_key
+                developerKey=api_key,
+                model=OrjsonModel() if ORJSON_AVAILABLE else None
             )
             print("✅ YouTube API 클라이언트 초기화 완료")
         except Exception as e:
@@ -66,6 +129,22 @@ class YouTubeClient:
         """할당량 사용 가능 여부 확인"""
         return (self.quota_used + cost) <= self.quota_limit
     
+    def _execute_in_thread(self, request):
+        """API 요청을 현재 스레드 전용 HTTP 연결로 실행"""
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            # build()가 쓰는 것과 같은 설정 (60초 타임아웃, 308 리다이렉트 미추적)
+            http = build_http()
+            self._thread_local.http = http
+        
+        return request.execute(http=http)
+    
+    def _execute_parallel(self, requests_to_run):
+        """API 요청 목록을 병렬로 실행 (결과는 입력 순서대로 반환)"""
+        workers = min(VIDEO_DETAILS_WORKERS, len(requests_to_run))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._execute_in_thread, requests_to_run))
+    
     def get_video_details(self, video_ids):
         """
         영상 상세 정보 가져오기 - 길이 정보 포함
@@ -81,34 +160,50 @@ class YouTubeClient:
         
         try:
             all_videos = []
-            batch_size = 50  # YouTube API 제한
+            batch_size = API_BATCH_SIZE
             
-            for i in range(0, len(video_ids), batch_size):
-                batch_ids = video_ids[i:i + batch_size]
-                
-                if not self.can_use_quota(1):
-                    print("⚠️ API 할당량 부족으로 일부 영상 정보를 가져올 수 없습니다.")
-                    break
-                
-                request = self.youtube.videos().list(
+            batches = [video_ids[i:i + batch_size] for i in range(0, len(video_ids), batch_size)]
+            
+            # 할당량 안에서 요청할 수 있는 배치만 남김 (배치당 1 유닛)
+            available = max(self.quota_limit - self.quota_used, 0)
+            if len(batches) > available:
+                print("⚠️ API 할당량 부족으로 일부 영상 정보를 가져올 수 없습니다.")
+                batches = batches[:available]
+            
+            if not batches:
+                return []
+            
+            # 요청 객체는 현재 스레드에서 만들고 실행만 병렬로 수행
+            requests_to_run = [
+                self.youtube.videos().list(
                     part='id,snippet,statistics,contentDetails',  # contentDetails 추가
                     id=','.join(batch_ids)
                 )
-                response = request.execute()
-                
+                for batch_ids in batches
+            ]
+            
+            # 결과는 입력 순서대로 돌아오므로 영상 순서가 유지됨
+            responses = self._execute_parallel(requests_to_run)
+            
+            for batch_index, (batch_ids, response) in enumerate(zip(batches, responses)):
                 # 영상 정보 처리
                 for video in response.get('items', []):
-                    # 영상 길이 파싱
+                    # 영상 길이 파싱 (표시용 문자열과 초 단위 값 모두 보관, 파싱 결과는 캐시됨)
                     duration = video.get('contentDetails', {}).get('duration', '')
                     video['parsed_duration'] = self.parse_duration(duration)
+                    video['duration_seconds'] = parse_duration_seconds(duration) or 0
+                    
+                    # 정렬/필터/지표 계산용 숫자 값 미리 계산 (이후 단계에서 반복 변환 방지)
+                    statistics = video.get('statistics', {})
+                    video['view_count'] = int(statistics.get('viewCount', 0))
+                    video['like_count'] = int(statistics.get('likeCount', 0))
+                    video['comment_count'] = int(statistics.get('commentCount', 0))
+                    video['published_at'] = video.get('snippet', {}).get('publishedAt', '')
                     
                     all_videos.append(video)
                 
                 self.quota_used += 1
-                print(f"   배치 {i//batch_size + 1}: {len(batch_ids)}개 영상 처리됨")
-                
-                # API 요청 간격 조절
-                time.sleep(0.1)
+                print(f"   배치 {batch_index + 1}: {len(batch_ids)}개 영상 처리됨")
                 
             print(f"✅ 총 {len(all_videos)}개 영상 상세 정보 수집 완료")
             return all_videos
@@ -126,21 +221,7 @@ class YouTubeClient:
             return "00:00"
         
         try:
-            # PT1H2M3S 형태의 duration 파싱
-            pattern = r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?'
-            match = re.match(pattern, duration)
-            
-            if not match:
-                return "00:00"
-            
-            hours = int(match.group(1) or 0)
-            minutes = int(match.group(2) or 0)
-            seconds = int(match.group(3) or 0)
-            
-            if hours > 0:
-                return f"{hours}:{minutes:02d}:{seconds:02d}"
-            else:
-                return f"{minutes}:{seconds:02d}"
+            return format_duration_text(duration)
                 
         except Exception as e:
             print(f"영상 길이 파싱 오류: {e}")
@@ -165,7 +246,8 @@ class YouTubeClient:
                 part='id,snippet,statistics,contentDetails',
                 id=channel_id
             )
-            response = request.execute()
+            # 스레드별 연결로 실행 (영상 목록 수집과 동시에 호출될 수 있음)
+            response = self._execute_in_thread(request)
             
             items = response.get('items', [])
             if items:
@@ -183,6 +265,98 @@ class YouTubeClient:
             print(f"❌ 채널 정보 가져오기 오류: {e}")
             return None
     
+    def get_channels_statistics(self, channel_ids):
+        """
+        여러 채널의 통계를 일괄 조회 (50개씩 묶어 병렬 요청)
+        
+        Args:
+            channel_ids (list): 채널 ID 목록
+            
+        Returns:
+            dict: 채널 ID -> statistics
+                  (응답에 없는 채널은 None, 할당량/오류로 요청하지 못한 채널은 제외)
+        """
+        if not channel_ids:
+            return {}
+        
+        try:
+            batch_size = API_BATCH_SIZE
+            batches = [channel_ids[i:i + batch_size] for i in range(0, len(channel_ids), batch_size)]
+            
+            # 할당량 안에서 요청할 수 있는 배치만 남김 (배치당 1 유닛)
+            available = max(self.quota_limit - self.quota_used, 0)
+            if len(batches) > available:
+                print("⚠️ API 할당량 부족으로 일부 채널 정보를 가져올 수 없습니다.")
+                batches = batches[:available]
+            
+            if not batches:
+                return {}
+            
+            requests_to_run = [
+                self.youtube.channels().list(
+                    part='id,statistics',
+                    id=','.join(batch_ids)
+                )
+                for batch_ids in batches
+            ]
+            responses = self._execute_parallel(requests_to_run)
+            self.quota_used += len(batches)
+            
+            statistics = {}
+            found = 0
+            for batch_ids, response in zip(batches, responses):
+                # 성공한 배치에서 빠진 채널(삭제/비공개 등)은 None으로 표시
+                statistics.update(dict.fromkeys(batch_ids))
+                for item in response.get('items', []):
+                    statistics[item['id']] = item.get('statistics', {})
+                    found += 1
+            
+            print(f"✅ 채널 통계 {found}개 일괄 조회 완료 ({len(batches)}회 요청)")
+            return statistics
+            
+        except HttpError as e:
+            print(f"❌ 채널 통계 API 오류: {e}")
+            return {}
+        except Exception as e:
+            print(f"❌ 채널 통계 가져오기 오류: {e}")
+            return {}
+    
+    def lookup_channel_id(self, identifier):
+        """
+        핸들/사용자명으로 채널 ID 직접 조회 (채널 검색 100유닛 대신 1~2유닛)
+        
+        Args:
+            identifier (str): 채널 핸들(@ 제외) 또는 사용자명
+            
+        Returns:
+            str: 채널 ID (찾지 못하면 None)
+        """
+        try:
+            if not self.can_use_quota(2):
+                return None
+            
+            # 핸들과 레거시 사용자명 조회를 동시에 요청
+            requests_to_run = [
+                self.youtube.channels().list(part='id', forHandle=identifier),
+                self.youtube.channels().list(part='id', forUsername=identifier)
+            ]
+            responses = self._execute_parallel(requests_to_run)
+            self.quota_used += len(requests_to_run)
+            
+            for response in responses:
+                items = response.get('items', [])
+                if items:
+                    return items[0]['id']
+            
+            return None
+            
+        except HttpError as e:
+            print(f"❌ 채널 핸들 조회 API 오류: {e}")
+            return None
+        except Exception as e:
+            print(f"❌ 채널 핸들 조회 오류: {e}")
+            return None
+    
     def get_channel_videos(self, channel_id, max_results=50, order='date'):
         """
         채널의 영상 목록 가져오기
@@ -196,12 +370,8 @@ class YouTubeClient:
             list: 영상 목록
         """
         try:
-            # 채널의 uploads 플레이리스트 ID 구하기
-            channel_info = self.get_channel_info(channel_id)
-            if not channel_info:
-                return []
-            
             # uploads 플레이리스트 ID는 채널 ID의 UC를 UU로 바꾼 것
+            # (채널 정보를 따로 조회하지 않음, 없는 채널이면 아래 요청이 오류를 반환)
             uploads_playlist_id = 'UU' + channel_id[2:] if channel_id.startswith('UC') else channel_id
             
             print(f"📺 채널 영상 목록 수집 중... (플레이리스트: {uploads_playlist_id})")
@@ -221,7 +391,7 @@ class YouTubeClient:
                     pageToken=page_token
                 )
                 
-                response = request.execute()
+                response = self._execute_in_thread(request)
                 items = response.get('items', [])
                 
                 if not items:
@@ -247,9 +417,9 @@ class YouTubeClient:
                 
                 # 정렬 적용
                 if order == 'date':
-                    videos.sort(key=lambda x: x['snippet']['publishedAt'], reverse=True)
+                    videos.sort(key=itemgetter('published_at'), reverse=True)
                 elif order == 'viewCount':
-                    videos.sort(key=lambda x: int(x['statistics'].get('viewCount', 0)), reverse=True)
+                    videos.sort(key=itemgetter('view_count'), reverse=True)
                 
                 return videos
             else:
@@ -262,13 +432,14 @@ class YouTubeClient:
             print(f"❌ 채널 영상 목록 가져오기 오류: {e}")
             return []
     
-    def search_channels(self, query, max_results=10):
+    def search_channels(self, query, max_results=10, fields=None):
         """
         채널 검색
         
         Args:
             query (str): 검색어
             max_results (int): 최대 결과 수
+            fields (str): 응답에서 받을 필드 (None이면 전체)
             
         Returns:
             list: 검색된 채널 목록
@@ -278,15 +449,20 @@ class YouTubeClient:
                 print("⚠️ API 할당량 부족으로 채널 검색을 할 수 없습니다.")
                 return []
             
-            request = self.youtube.search().list(
-                part='snippet',
-                q=query,
-                type='channel',
-                maxResults=max_results,
-                order='relevance'
-            )
+            params = {
+                'part': 'snippet',
+                'q': query,
+                'type': 'channel',
+                'maxResults': max_results,
+                'order': 'relevance'
+            }
+            if fields:
+                params['fields'] = fields
             
-            response = request.execute()
+            request = self.youtube.search().list(**params)
+            
+            # 작업 스레드에서 호출될 수 있으므로 스레드 전용 HTTP 연결로 실행
+            response = self._execute_in_thread(request)
             channels = response.get('items', [])
             
             self.quota_used += 100
@@ -337,6 +513,7 @@ class YouTubeClient:
             for video in videos:
                 duration = video.get('contentDetails', {}).get('duration', '')
                 video['parsed_duration'] = self.parse_duration(duration)
+                video['duration_seconds'] = parse_duration_seconds(duration) or 0
             
             self.quota_used += 1
             print(f"📈 트렌딩 영상 {len(videos)}개 수집 완료 ({region_code})")
@@ -473,27 +650,19 @@ class YouTubeClient:
     def extract_channel_id_from_url(self, url):
         """YouTube URL에서 채널 ID 추출"""
         try:
-            patterns = [
-                r'youtube\.com/channel/([UC][a-zA-Z0-9_-]{22})',
-                r'youtube\.com/c/([a-zA-Z0-9_.-]+)',
-                r'youtube\.com/user/([a-zA-Z0-9_.-]+)',
-                r'youtube\.com/@([a-zA-Z0-9_.-]+)'
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, url)
-                if match:
-                    identifier = match.group(1)
-                    
-                    # UC로 시작하는 경우 채널 ID
-                    if identifier.startswith('UC'):
-                        return identifier
-                    else:
-                        # 핸들이나 사용자명인 경우 검색으로 채널 ID 찾기
-                        return self.resolve_channel_identifier(identifier)
+            match = CHANNEL_URL_PATTERN.search(url)
+            if match:
+                identifier = match.group(match.lastgroup)
+                
+                # UC로 시작하는 경우 채널 ID
+                if identifier.startswith('UC'):
+                    return identifier
+                else:
+                    # 핸들이나 사용자명인 경우 검색으로 채널 ID 찾기
+                    return self.resolve_channel_identifier(identifier)
             
             # 직접 채널 ID인 경우
-            if re.match(r'^UC[a-zA-Z0-9_-]{22}$', url):
+            if CHANNEL_ID_PATTERN.match(url):
                 return url
             
             # 핸들명인 경우
@@ -503,16 +672,48 @@ class YouTubeClient:
             print(f"채널 ID 추출 오류: {e}")
             return None
     
-    def resolve_channel_identifier(self, identifier):
-        """채널 핸들이나 사용자명을 채널 ID로 변환"""
+    def resolve_channel_identifier(self, identifier, use_first_result=False):
+        """
+        채널 핸들이나 사용자명을 채널 ID로 변환 (결과는 디스크에 캐시)
+        
+        Args:
+            identifier (str): 채널 핸들 또는 사용자명
+            use_first_result (bool): 이름이 일치하는 채널이 없으면 첫 번째 검색 결과 사용 (캐시하지 않음)
+            
+        Returns:
+            str: 채널 ID (찾지 못하면 None)
+        """
         try:
+            # 이전에 변환한 적이 있으면 검색 API(100유닛)를 호출하지 않음
+            cache_key = identifier.lower()
+            cached_id = load_json_cache('channel_handles', cache_key, CHANNEL_HANDLE_CACHE_TTL)
+            if cached_id:
+                print(f"📋 캐시에서 채널 ID 로드: '{identifier}' -> {cached_id}")
+                return cached_id
+            
+            # 핸들/사용자명 직접 조회 (검색보다 빠르고 할당량도 적게 사용)
+            channel_id = self.lookup_channel_id(identifier)
+            if channel_id:
+                print(f"✅ 채널 핸들 조회 완료: '{identifier}' -> {channel_id}")
+                save_json_cache('channel_handles', cache_key, channel_id)
+                return channel_id
+            
             # 채널 검색으로 시도
-            channels = self.search_channels(identifier, max_results=5)
+            print(f"🔍 채널 검색 중: '{identifier}'")
+            channels = self.search_channels(identifier, max_results=5, fields=CHANNEL_ID_SEARCH_FIELDS)
             
             for channel in channels:
                 channel_title = channel['snippet']['title'].lower()
-                if identifier.lower() in channel_title or channel_title in identifier.lower():
-                    return channel['id']['channelId']
+                if cache_key in channel_title or channel_title in cache_key:
+                    channel_id = channel['id']['channelId']
+                    print(f"✅ 채널 발견: {channel['snippet']['title']} (ID: {channel_id})")
+                    save_json_cache('channel_handles', cache_key, channel_id)
+                    return channel_id
+            
+            if use_first_result and channels:
+                first_channel = channels[0]
+                print(f"⚠️ 정확한 일치를 찾지 못했습니다. 첫 번째 결과 사용: {first_channel['snippet']['title']}")
+                return first_channel['id']['channelId']
             
             print(f"⚠️ '{identifier}'에 해당하는 채널을 찾을 수 없습니다.")
             return None
@@ -532,6 +733,40 @@ class YouTubeClient:
 
 
 # 유틸리티 함수들
+def format_duration_text(duration):
+    """YouTube 영상 길이를 표시용 문자열로 변환 (PT1H2M3S -> 1:02:03, 형식이 맞지 않으면 00:00)"""
+    total_seconds = parse_duration_seconds(duration)
+    if total_seconds is None:
+        return "00:00"
+    
+    return format_seconds(total_seconds)
+
+def create_http_session(pool_size=32, retries=3):
+    """
+    연결 풀과 재시도가 설정된 HTTP 세션 생성
+    
+    Args:
+        pool_size (int): 호스트별 유지할 최대 연결 수
+        retries (int): 연결/서버 오류 시 재시도 횟수
+        
+    Returns:
+        requests.Session: 공유용 세션
+    """
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    })
+    
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=retries, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    
+    return session
+
 def create_client(api_key=None):
     """
     YouTube 클라이언트 생성 헬퍼 함수
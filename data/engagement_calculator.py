@@ -4,8 +4,25 @@
 """
 
 import math
-from datetime import datetime, timedelta
+import time
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
 from collections import defaultdict
+from operator import itemgetter
+import config
+from utils import parse_duration
+
+# 선택적 import (대량 영상 일괄 계산용)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    print("⚠️ NumPy가 설치되지 않았습니다. 일괄 참여도 계산이 기본 방식으로 처리됩니다.")
+
+# Outlier Score 등급 경계값과 등급 이름 (경계값 이상이면 다음 등급)
+OUTLIER_CATEGORY_THRESHOLDS = (0.7, 1.5, 3.0, 5.0)
+OUTLIER_CATEGORY_LABELS = ("📉 저조", "😐 평균", "📈 양호", "⭐ 히트", "🔥 바이럴")
 
 class EngagementCalculator:
     """참여도 계산 클래스"""
@@ -29,27 +46,7 @@ class EngagementCalculator:
             float: 참여도 점수 (0-100)
         """
         try:
-            stats = video_data.get('statistics', {})
-            
-            view_count = int(stats.get('viewCount', 0))
-            like_count = int(stats.get('likeCount', 0))
-            comment_count = int(stats.get('commentCount', 0))
-            
-            if view_count == 0:
-                return 0.0
-            
-            # 참여도 비율 계산
-            like_rate = (like_count / view_count) * 100
-            comment_rate = (comment_count / view_count) * 100
-            
-            # 가중 평균으로 참여도 점수 계산
-            engagement_score = (
-                like_rate * self.engagement_weights['like_weight'] + 
-                comment_rate * self.engagement_weights['comment_weight']
-            ) * 1000  # 0-100 범위로 스케일링
-            
-            # 0-100 범위로 제한
-            return min(round(engagement_score, 2), 100.0)
+            return self._engagement_score_from_counts(*self._video_counts(video_data))
             
         except Exception as e:
             print(f"참여도 점수 계산 오류: {e}")
@@ -66,14 +63,8 @@ class EngagementCalculator:
             float: 좋아요율 (%)
         """
         try:
-            stats = video_data.get('statistics', {})
-            view_count = int(stats.get('viewCount', 0))
-            like_count = int(stats.get('likeCount', 0))
-            
-            if view_count == 0:
-                return 0.0
-            
-            return round((like_count / view_count) * 100, 4)
+            view_count, like_count, _ = self._video_counts(video_data)
+            return self._rate_from_counts(like_count, view_count)
             
         except Exception as e:
             print(f"좋아요율 계산 오류: {e}")
@@ -90,19 +81,96 @@ class EngagementCalculator:
             float: 댓글율 (%)
         """
         try:
-            stats = video_data.get('statistics', {})
-            view_count = int(stats.get('viewCount', 0))
-            comment_count = int(stats.get('commentCount', 0))
-            
-            if view_count == 0:
-                return 0.0
-            
-            return round((comment_count / view_count) * 100, 4)
+            view_count, _, comment_count = self._video_counts(video_data)
+            return self._rate_from_counts(comment_count, view_count)
             
         except Exception as e:
             print(f"댓글율 계산 오류: {e}")
             return 0.0
     
+    def calculate_batch_metrics(self, videos_list, shorts_max_seconds=None):
+        """
+        영상 목록의 참여율, Outlier 점수, 일평균 조회수, 영상 유형 일괄 계산
+        
+        Args:
+            videos_list (list): 영상 데이터 목록 (duration_seconds 또는 parsed_duration 포함)
+            shorts_max_seconds (int): 쇼츠로 분류할 최대 길이 (초, 기본값은 config.SHORT_VIDEO_MAX_DURATION)
+            
+        Returns:
+            list: 영상별 {'engagement_rate', 'outlier_score', 'views_per_day', 'video_type'} 목록
+        """
+        if not videos_list:
+            return []
+        
+        # filter_by_video_type과 같은 기준으로 쇼츠 분류
+        if shorts_max_seconds is None:
+            shorts_max_seconds = config.SHORT_VIDEO_MAX_DURATION
+        
+        views, reactions, durations, published = self._extract_metric_columns(videos_list)
+        now = time.time()
+        
+        if NUMPY_AVAILABLE:
+            views = np.asarray(views, dtype=np.float64)
+            reactions = np.asarray(reactions, dtype=np.float64)
+            published = np.asarray(published, dtype=np.float64)  # 날짜 없음은 NaN
+            
+            rates = np.divide(reactions * 100, views, out=np.zeros_like(views), where=views > 0)
+            outliers = np.minimum(rates * 10, 100)
+            is_shorts = np.asarray(durations) <= shorts_max_seconds
+            
+            # 경과 일수 (최소 1일), 날짜가 없으면 NaN이 전파되어 0으로 처리
+            elapsed_days = np.maximum(np.floor((now - published) / 86400), 1)
+            views_per_day = np.nan_to_num(np.round(views / elapsed_days, 2), nan=0.0)
+            
+            rates, outliers, is_shorts = rates.tolist(), outliers.tolist(), is_shorts.tolist()
+            views_per_day = views_per_day.tolist()
+        else:
+            rates = [(r / v) * 100 if v > 0 else 0.0 for r, v in zip(reactions, views)]
+            outliers = [min(rate * 10, 100) for rate in rates]
+            is_shorts = [d <= shorts_max_seconds for d in durations]
+            views_per_day = [
+                round(v / max((now - p) // 86400, 1), 2) if p == p else 0.0
+                for v, p in zip(views, published)
+            ]
+        
+        return [
+            {
+                'engagement_rate': rate,
+                'outlier_score': outlier,
+                'views_per_day': per_day,
+                'video_type': '쇼츠' if shorts else '롱폼'
+            }
+            for rate, outlier, per_day, shorts in zip(rates, outliers, views_per_day, is_shorts)
+        ]
+    
+    def _extract_metric_columns(self, videos_list):
+        """
+        영상 목록을 한 번 순회해 지표 계산용 숫자 열(조회수, 반응수, 길이, 업로드 시각)로 변환
+        
+        상세 정보 조회 시 미리 계산된 값(view_count 등)이 있으면 statistics를 다시 변환하지 않음
+        """
+        views, reactions, durations, published = [], [], [], []
+        safe_count = self._safe_count
+        to_seconds = self._duration_text_to_seconds
+        to_timestamp = self._published_to_timestamp
+        add_view, add_reaction, add_duration = views.append, reactions.append, durations.append
+        add_published = published.append
+        
+        for video in videos_list:
+            if 'like_count' in video:
+                add_view(video['view_count'])
+                add_reaction(video['like_count'] + video['comment_count'])
+            else:
+                stats = video.get('statistics', {})
+                add_view(safe_count(stats.get('viewCount')))
+                add_reaction(safe_count(stats.get('likeCount')) + safe_count(stats.get('commentCount')))
+            
+            duration_seconds = video.get('duration_seconds')
+            add_duration(duration_seconds if duration_seconds is not None else to_seconds(video.get('parsed_duration')))
+            add_published(to_timestamp(video.get('published_at') or video.get('snippet', {}).get('publishedAt')))
+        
+        return views, reactions, durations, published
+    
     def calculate_outlier_score(self, current_video_stats, channel_avg_stats):
         """
         vidIQ의 Outlier Score와 유사한 지표 계산
@@ -155,23 +223,15 @@ class EngagementCalculator:
         Returns:
             str: 카테고리
         """
-        if outlier_score >= 5.0:
-            return "🔥 바이럴"
-        elif outlier_score >= 3.0:
-            return "⭐ 히트"
-        elif outlier_score >= 1.5:
-            return "📈 양호"
-        elif outlier_score >= 0.7:
-            return "😐 평균"
-        else:
-            return "📉 저조"
+        return OUTLIER_CATEGORY_LABELS[bisect_right(OUTLIER_CATEGORY_THRESHOLDS, outlier_score)]
     
-    def calculate_views_per_day(self, video_data):
+    def calculate_views_per_day(self, video_data, now=None):
         """
         일일 평균 조회수 계산
         
         Args:
             video_data (dict): 영상 데이터
+            now (datetime): 기준 시각 (여러 영상 계산 시 한 번만 구해 전달, 없으면 현재 시각)
             
         Returns:
             float: 일일 평균 조회수
@@ -182,7 +242,7 @@ class EngagementCalculator:
             
             # 업로드 날짜 파싱
             upload_date = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-            current_date = datetime.now(upload_date.tzinfo)
+            current_date = now if now is not None else datetime.now(upload_date.tzinfo)
             
             # 경과 일수 계산
             days_elapsed = (current_date - upload_date).days
@@ -195,12 +255,13 @@ class EngagementCalculator:
             print(f"일일 평균 조회수 계산 오류: {e}")
             return 0.0
     
-    def calculate_growth_velocity(self, video_data):
+    def calculate_growth_velocity(self, video_data, now=None):
         """
         성장 속도 계산 (시간당 조회수 증가율)
         
         Args:
             video_data (dict): 영상 데이터
+            now (datetime): 기준 시각 (여러 영상 계산 시 한 번만 구해 전달, 없으면 현재 시각)
             
         Returns:
             dict: 성장 속도 정보
@@ -210,7 +271,7 @@ class EngagementCalculator:
             view_count = int(video_data['statistics'].get('viewCount', 0))
             
             upload_date = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-            current_date = datetime.now(upload_date.tzinfo)
+            current_date = now if now is not None else datetime.now(upload_date.tzinfo)
             
             hours_elapsed = (current_date - upload_date).total_seconds() / 3600
             if hours_elapsed == 0:
@@ -273,9 +334,11 @@ class EngagementCalculator:
             engagement_data = []
             
             for video in videos_list:
-                engagement_score = self.calculate_engagement_score(video)
-                like_rate = self.calculate_like_rate(video)
-                comment_rate = self.calculate_comment_rate(video)
+                # 통계 값은 영상당 한 번만 변환해서 모든 지표에 재사용
+                view_count, like_count, comment_count = self._video_counts(video)
+                engagement_score = self._engagement_score_from_counts(view_count, like_count, comment_count)
+                like_rate = self._rate_from_counts(like_count, view_count)
+                comment_rate = self._rate_from_counts(comment_count, view_count)
                 
                 published_at = video['snippet']['publishedAt']
                 upload_date = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
@@ -285,11 +348,11 @@ class EngagementCalculator:
                     'engagement_score': engagement_score,
                     'like_rate': like_rate,
                     'comment_rate': comment_rate,
-                    'views': int(video['statistics'].get('viewCount', 0))
+                    'views': view_count
                 })
             
             # 시간순으로 정렬
-            engagement_data.sort(key=lambda x: x['date'])
+            engagement_data.sort(key=itemgetter('date'))
             
             # 트렌드 계산
             if len(engagement_data) >= 2:
@@ -310,7 +373,7 @@ class EngagementCalculator:
                     'recent_avg_engagement': round(recent_avg, 2) if len(engagement_data) >= 2 else 0,
                     'overall_avg_engagement': round(sum(d['engagement_score'] for d in engagement_data) / len(engagement_data), 2)
                 },
-                'peak_performance': max(engagement_data, key=lambda x: x['engagement_score']) if engagement_data else None,
+                'peak_performance': max(engagement_data, key=itemgetter('engagement_score')) if engagement_data else None,
                 'total_videos_analyzed': len(engagement_data)
             }
             
@@ -393,10 +456,11 @@ class EngagementCalculator:
             view_counts = []
             
             for video in channel_videos:
-                engagement_scores.append(self.calculate_engagement_score(video))
-                like_rates.append(self.calculate_like_rate(video))
-                comment_rates.append(self.calculate_comment_rate(video))
-                view_counts.append(int(video['statistics'].get('viewCount', 0)))
+                view_count, like_count, comment_count = self._video_counts(video)
+                engagement_scores.append(self._engagement_score_from_counts(view_count, like_count, comment_count))
+                like_rates.append(self._rate_from_counts(like_count, view_count))
+                comment_rates.append(self._rate_from_counts(comment_count, view_count))
+                view_counts.append(view_count)
             
             return {
                 'total_videos': len(channel_videos),
@@ -432,14 +496,15 @@ class EngagementCalculator:
     
     def _calculate_all_metrics(self, video_data):
         """영상의 모든 지표 계산"""
+        view_count, like_count, comment_count = self._video_counts(video_data)
         return {
-            'engagement_score': self.calculate_engagement_score(video_data),
-            'like_rate': self.calculate_like_rate(video_data),
-            'comment_rate': self.calculate_comment_rate(video_data),
+            'engagement_score': self._engagement_score_from_counts(view_count, like_count, comment_count),
+            'like_rate': self._rate_from_counts(like_count, view_count),
+            'comment_rate': self._rate_from_counts(comment_count, view_count),
             'views_per_day': self.calculate_views_per_day(video_data),
-            'view_count': int(video_data['statistics'].get('viewCount', 0)),
-            'like_count': int(video_data['statistics'].get('likeCount', 0)),
-            'comment_count': int(video_data['statistics'].get('commentCount', 0))
+            'view_count': view_count,
+            'like_count': like_count,
+            'comment_count': comment_count
         }
     
     def _determine_overall_winner(self, comparison):
@@ -454,6 +519,59 @@ class EngagementCalculator:
         else:
             return "similar"
     
+    def _video_counts(self, video_data):
+        """영상의 (조회수, 좋아요수, 댓글수)를 한 번에 정수로 변환"""
+        stats = video_data.get('statistics', {})
+        safe_count = self._safe_count
+        return (
+            safe_count(stats.get('viewCount')),
+            safe_count(stats.get('likeCount')),
+            safe_count(stats.get('commentCount'))
+        )
+    
+    def _rate_from_counts(self, count, view_count):
+        """조회수 대비 비율 (%)"""
+        if view_count == 0:
+            return 0.0
+        
+        return round((count / view_count) * 100, 4)
+    
+    def _engagement_score_from_counts(self, view_count, like_count, comment_count):
+        """이미 변환된 통계 값으로 참여도 점수 계산 (0-100)"""
+        if view_count == 0:
+            return 0.0
+        
+        # 참여도 비율 계산
+        like_rate = (like_count / view_count) * 100
+        comment_rate = (comment_count / view_count) * 100
+        
+        # 가중 평균으로 참여도 점수 계산
+        engagement_score = (
+            like_rate * self.engagement_weights['like_weight'] + 
+            comment_rate * self.engagement_weights['comment_weight']
+        ) * 1000  # 0-100 범위로 스케일링
+        
+        # 0-100 범위로 제한
+        return min(round(engagement_score, 2), 100.0)
+    
+    def _safe_count(self, value):
+        """API 통계 값을 정수로 변환 (누락/오류 시 0)"""
+        try:
+            return int(value or 0)
+        except (ValueError, TypeError):
+            return 0
+    
+    def _published_to_timestamp(self, published_at):
+        """업로드 시각(ISO 8601) 문자열을 epoch 초로 변환 (누락/오류 시 NaN)"""
+        try:
+            return datetime.fromisoformat(published_at.replace('Z', '+00:00')).timestamp()
+        except (AttributeError, ValueError):
+            return float('nan')
+    
+    def _duration_text_to_seconds(self, duration_text):
+        """표시용 길이 문자열을 초 단위로 변환 (1:02:03 -> 3723, 결과 캐시)"""
+        return parse_duration(duration_text)
+    
     def _calculate_median(self, values):
         """중간값 계산"""
         if not values:
@@ -558,30 +676,32 @@ class PerformanceAnalyzer:
             return {}
         
         try:
-            # 각 영상의 성과 지표 계산
+            # 각 영상의 성과 지표 계산 (경과 시간 기준 시각은 한 번만 구함)
             performance_data = []
+            now = datetime.now(timezone.utc)
             
             for video in videos_list:
-                if criteria == 'engagement':
-                    score = self.calc.calculate_engagement_score(video)
-                elif criteria == 'views':
-                    score = int(video['statistics'].get('viewCount', 0))
+                view_count, like_count, comment_count = self.calc._video_counts(video)
+                engagement_score = self.calc._engagement_score_from_counts(view_count, like_count, comment_count)
+                
+                if criteria == 'views':
+                    score = view_count
                 elif criteria == 'growth':
-                    growth_info = self.calc.calculate_growth_velocity(video)
+                    growth_info = self.calc.calculate_growth_velocity(video, now)
                     score = growth_info['views_per_hour']
                 else:
-                    score = self.calc.calculate_engagement_score(video)
+                    score = engagement_score
                 
                 performance_data.append({
                     'video': video,
                     'score': score,
                     'title': video['snippet']['title'],
-                    'views': int(video['statistics'].get('viewCount', 0)),
-                    'engagement_score': self.calc.calculate_engagement_score(video)
+                    'views': view_count,
+                    'engagement_score': engagement_score
                 })
             
             # 점수 기준으로 정렬
-            performance_data.sort(key=lambda x: x['score'], reverse=True)
+            performance_data.sort(key=itemgetter('score'), reverse=True)
             
             # 성과 구간 분석
             total_videos = len(performance_data)
@@ -6,7 +6,8 @@
 import math
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta
-import re
+
+from utils import parse_duration
 
 class StatisticsCalculator:
     """통계 계산 클래스"""
@@ -317,9 +318,10 @@ class StatisticsCalculator:
                     metrics_data['likes'].append(int(stats.get('likeCount', 0)))
                     metrics_data['comments'].append(int(stats.get('commentCount', 0)))
                     
-                    # 영상 길이 (초 단위)
-                    duration_str = content_details.get('duration', 'PT0S')
-                    duration_seconds = self._parse_duration(duration_str)
+                    # 영상 길이 (초 단위, 검색 단계에서 계산된 값이 있으면 재사용)
+                    duration_seconds = video.get('duration_seconds')
+                    if duration_seconds is None:
+                        duration_seconds = self._parse_duration(content_details.get('duration', 'PT0S'))
                     metrics_data['duration'].append(duration_seconds)
                     
                     # 제목 길이
@@ -941,22 +943,8 @@ class StatisticsCalculator:
             return 0
     
     def _parse_duration(self, duration_str):
-        """YouTube duration 파싱"""
-        try:
-            # PT15M33S 형태 파싱
-            pattern = r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?'
-            match = re.match(pattern, duration_str)
-            
-            if not match:
-                return 0
-            
-            hours = int(match.group(1) or 0)
-            minutes = int(match.group(2) or 0)
-            seconds = int(match.group(3) or 0)
-            
-            return hours * 3600 + minutes * 60 + seconds
-        except:
-            return 0
+        """YouTube duration 파싱 (형식이 맞지 않으면 0, 결과 캐시)"""
+        return parse_duration(duration_str)
     
     def _identify_interesting_correlations(self, correlation_results):
         """흥미로운 상관관계 식별"""
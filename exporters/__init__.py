@@ -3,6 +3,8 @@ exporters/__init__.py
 Exporters 모듈의 진입점
 """
 
+import heapq
+
 from .excel_exporter import ExcelExporter, quick_excel_export, export_comparison_report
 from .thumbnail_downloader import ThumbnailDownloader, quick_thumbnail_download, download_top_performers_thumbnails, create_thumbnail_comparison_grid
 from .transcript_downloader import TranscriptDownloader, quick_transcript_download, download_high_performance_transcripts, extract_transcript_keywords, compare_transcript_methods
@@ -186,9 +188,12 @@ def export_top_performers(videos_data, top_count=10, min_outlier_score=2.0,
         if outlier_score >= min_outlier_score:
             high_performers.append(video)
     
-    # 상위 개수만큼 선택 (Outlier Score 기준 정렬)
-    high_performers.sort(key=lambda x: x.get('analysis', {}).get('outlier_score', 0), reverse=True)
-    selected_videos = high_performers[:top_count]
+    # 상위 개수만큼 선택 (Outlier Score 기준, 전체 정렬 없이 상위 개수만)
+    selected_videos = heapq.nlargest(
+        top_count,
+        high_performers,
+        key=lambda x: x.get('analysis', {}).get('outlier_score', 0)
+    )
     
     if not selected_videos:
         return {
@@ -4,8 +4,10 @@
 """
 
 import os
+import heapq
 import pandas as pd
 from datetime import datetime
+from collections import defaultdict
 import xlsxwriter
 from openpyxl import load_workbook
 from openpyxl.drawing import image
@@ -76,13 +78,23 @@ class ExcelExporter:
                 # 5. 성과 분석 시트
                 self._create_performance_analysis_sheet(writer, video_data_list)
             
-            # 썸네일 이미지 삽입 (openpyxl 사용)
-            if config.THUMBNAIL_COLUMN_WIDTH:
-                self._insert_thumbnails(video_data_list)
-            
-            # 차트 추가
-            if include_charts:
-                self._add_charts(video_data_list)
+            # 썸네일/차트는 openpyxl로 파일을 한 번만 다시 열어 함께 처리
+            insert_thumbnails = bool(config.THUMBNAIL_COLUMN_WIDTH)
+            if insert_thumbnails or include_charts:
+                try:
+                    workbook = load_workbook(self.filename)
+                    
+                    # 썸네일 이미지 삽입
+                    if insert_thumbnails:
+                        self._insert_thumbnails(workbook, video_data_list)
+                    
+                    # 차트 추가
+                    if include_charts:
+                        self._add_charts(workbook, video_data_list)
+                    
+                    workbook.save(self.filename)
+                except Exception as e:
+                    print(f"⚠️ 썸네일/차트 추가 오류: {e}")
             
             print(f"✅ 엑셀 파일 생성 완료: {self.filename}")
             return self.filename
@@ -98,12 +110,16 @@ class ExcelExporter:
         for video_data in video_data_list:
             snippet = video_data.get('snippet', {})
             statistics = video_data.get('statistics', {})
-            content_details = video_data.get('contentDetails', {})
             analysis = video_data.get('analysis', {})
             
-            # 영상 길이 정보
-            duration_seconds = analysis.get('duration_seconds', 0)
-            formatted_duration = analysis.get('formatted_duration', '00:00')
+            # 여러 번 쓰는 값은 한 번만 조회
+            title = snippet.get('title', '')
+            outlier_score = analysis.get('outlier_score', 1.0)
+            sentiment = analysis.get('sentiment', {})
+            
+            # 영상 길이 정보 (검색 단계에서 미리 계산된 값 재사용)
+            duration_seconds = analysis.get('duration_seconds', video_data.get('duration_seconds', 0))
+            formatted_duration = analysis.get('formatted_duration') or video_data.get('parsed_duration', '00:00')
             video_type = analysis.get('video_type', '알수없음')
             
             # 카테고리 이름 변환
@@ -114,7 +130,7 @@ class ExcelExporter:
                 # 기본 정보
                 '순위': video_data.get('rank', 0),
                 '썸네일': '',  # 이미지는 별도로 삽입
-                '제목': snippet.get('title', ''),
+                '제목': title,
                 '채널명': snippet.get('channelTitle', ''),
                 '카테고리': category_name,
                 
@@ -132,7 +148,7 @@ class ExcelExporter:
                 '댓글율': analysis.get('comment_rate', 0),
                 
                 # 분석 지표
-                'Outlier점수': analysis.get('outlier_score', 1.0),
+                'Outlier점수': outlier_score,
                 'Outlier등급': analysis.get('outlier_category', '😐 평균'),
                 '참여도점수': analysis.get('engagement_score', 0),
                 '일평균조회수': analysis.get('views_per_day', 0),
@@ -140,16 +156,16 @@ class ExcelExporter:
                 
                 # 채널 비교
                 '채널평균조회수': analysis.get('channel_avg_views', 0),
-                '채널대비성과': f"{analysis.get('outlier_score', 1.0):.1f}x",
+                '채널대비성과': f"{outlier_score:.1f}x",
                 
                 # 컨텐츠 분석
                 '핵심키워드': ', '.join(analysis.get('keywords', [])),
-                '제목길이': len(snippet.get('title', '')),
+                '제목길이': len(title),
                 
                 # 감정 분석 (댓글이 있는 경우)
-                '댓글감정_긍정': f"{analysis.get('sentiment', {}).get('positive', 0):.1f}%",
-                '댓글감정_중립': f"{analysis.get('sentiment', {}).get('neutral', 0):.1f}%",
-                '댓글감정_부정': f"{analysis.get('sentiment', {}).get('negative', 0):.1f}%",
+                '댓글감정_긍정': f"{sentiment.get('positive', 0):.1f}%",
+                '댓글감정_중립': f"{sentiment.get('neutral', 0):.1f}%",
+                '댓글감정_부정': f"{sentiment.get('negative', 0):.1f}%",
                 
                 # 링크
                 '영상링크': f"https://www.youtube.com/watch?v={video_data.get('id', '')}",
@@ -185,10 +201,8 @@ class ExcelExporter:
         # 행 높이 설정
         worksheet.set_default_row(config.THUMBNAIL_ROW_HEIGHT)
         
-        # 데이터 행 포맷팅 (영상 유형별 색상)
-        for row_num in range(1, len(df) + 1):
-            video_type = df.iloc[row_num-1]['영상유형']
-            
+        # 데이터 행 포맷팅 (영상 유형별 색상, 행마다 iloc 조회 없이 열을 한 번에 순회)
+        for row_num, video_type in enumerate(df['영상유형'].tolist(), start=1):
             if video_type == '쇼츠':
                 worksheet.set_row(row_num, None, formats['shorts'])
             elif video_type == '롱폼':
@@ -515,21 +529,22 @@ class ExcelExporter:
             sheet.write(row, col, header, header_format)
         row += 1
         
-        # 상위 10개 데이터
-        top_videos = sorted(videos, key=lambda x: x.get('analysis', {}).get('outlier_score', 0), reverse=True)[:10]
+        # 상위 10개 데이터 (전체 정렬 없이 상위 10개만 선택)
+        top_videos = heapq.nlargest(10, videos, key=lambda x: x.get('analysis', {}).get('outlier_score', 0))
         
         for i, video in enumerate(top_videos, 1):
             snippet = video.get('snippet', {})
             statistics = video.get('statistics', {})
             analysis = video.get('analysis', {})
+            title = snippet.get('title', '')
             
             data = [
                 i,
-                snippet.get('title', '')[:40] + '...' if len(snippet.get('title', '')) > 40 else snippet.get('title', ''),
+                title[:40] + '...' if len(title) > 40 else title,
                 snippet.get('channelTitle', ''),
                 int(statistics.get('viewCount', 0)),
                 analysis.get('outlier_score', 1.0),
-                analysis.get('formatted_duration', '00:00'),
+                analysis.get('formatted_duration') or video.get('parsed_duration', '00:00'),
                 analysis.get('engagement_score', 0)
             ]
             
@@ -546,10 +561,9 @@ class ExcelExporter:
         sheet.set_column('F:F', 10)
         sheet.set_column('G:G', 12)
     
-    def _insert_thumbnails(self, video_data_list):
-        """썸네일 이미지를 엑셀에 삽입"""
+    def _insert_thumbnails(self, workbook, video_data_list):
+        """썸네일 이미지를 엑셀에 삽입 (저장은 호출자가 수행)"""
         try:
-            workbook = load_workbook(self.filename)
             worksheet = workbook['영상 분석 결과']
             
             thumbnails_found = False
@@ -587,8 +601,6 @@ class ExcelExporter:
                 else:
                     worksheet[f'B{i}'] = '썸네일 없음'
             
-            workbook.save(self.filename)
-            
             if thumbnails_found:
                 print("✅ 썸네일 이미지가 엑셀에 삽입되었습니다.")
             else:
@@ -597,11 +609,9 @@ class ExcelExporter:
         except Exception as e:
             print(f"⚠️ 썸네일 삽입 오류: {e}")
     
-    def _add_charts(self, video_data_list):
-        """차트 추가"""
+    def _add_charts(self, workbook, video_data_list):
+        """차트 추가 (저장은 호출자가 수행)"""
         try:
-            workbook = load_workbook(self.filename)
-            
             # 차트 시트 생성
             if '📊 차트 분석' in workbook.sheetnames:
                 chart_sheet = workbook['📊 차트 분석']
@@ -614,7 +624,6 @@ class ExcelExporter:
             # 성과 분포 막대 차트
             self._create_performance_bar_chart(workbook, chart_sheet, video_data_list)
             
-            workbook.save(self.filename)
             print("✅ 차트가 추가되었습니다.")
             
         except Exception as e:
@@ -700,33 +709,24 @@ class ExcelExporter:
     
     def _calculate_video_type_stats(self, video_data_list):
         """영상 유형별 통계 계산"""
-        video_type_stats = {}
+        # 유형이 처음 나오면 빈 집계를 자동 생성
+        video_type_stats = defaultdict(lambda: {'count': 0, 'total_views': 0, 'total_outlier': 0})
         
         for video in video_data_list:
-            video_type = video.get('analysis', {}).get('video_type', '알수없음')
-            
-            if video_type not in video_type_stats:
-                video_type_stats[video_type] = {
-                    'count': 0,
-                    'total_views': 0,
-                    'total_outlier': 0
-                }
-            
-            stats = video.get('statistics', {})
             analysis = video.get('analysis', {})
+            type_stats = video_type_stats[analysis.get('video_type', '알수없음')]
             
-            video_type_stats[video_type]['count'] += 1
-            video_type_stats[video_type]['total_views'] += int(stats.get('viewCount', 0))
-            video_type_stats[video_type]['total_outlier'] += analysis.get('outlier_score', 1.0)
+            type_stats['count'] += 1
+            type_stats['total_views'] += int(video.get('statistics', {}).get('viewCount', 0))
+            type_stats['total_outlier'] += analysis.get('outlier_score', 1.0)
         
         # 평균 계산
-        for video_type in video_type_stats:
-            count = video_type_stats[video_type]['count']
-            if count > 0:
-                video_type_stats[video_type]['avg_views'] = video_type_stats[video_type]['total_views'] // count
-                video_type_stats[video_type]['avg_outlier'] = video_type_stats[video_type]['total_outlier'] / count
+        for type_stats in video_type_stats.values():
+            count = type_stats['count']
+            type_stats['avg_views'] = type_stats['total_views'] // count
+            type_stats['avg_outlier'] = type_stats['total_outlier'] / count
         
-        return video_type_stats
+        return dict(video_type_stats)
     
     def _define_styles(self):
         """스타일 정의"""
@@ -5,6 +5,7 @@ YouTube 영상 썸네일 다운로드, 크기 조정, 압축 기능 담당
 
 import os
 import re
+import heapq
 import requests
 import zipfile
 from datetime import datetime
@@ -12,28 +13,70 @@ from pathlib import Path
 from PIL import Image
 from io import BytesIO
 import concurrent.futures
+import threading
 import time
 import config
+from core.youtube_client import create_http_session
+
+# 요청 품질별 썸네일 탐색 순서 (호출마다 만들지 않도록 모듈 상수로 유지)
+THUMBNAIL_QUALITY_PRIORITY = {
+    'maxres': ('maxres', 'high', 'medium', 'default'),
+    'high': ('high', 'medium', 'default'),
+    'medium': ('medium', 'default', 'high'),
+    'default': ('default', 'medium', 'high')
+}
+
+# 세션을 넘기지 않은 다운로더가 함께 쓰는 HTTP 세션의 연결 풀 크기 (최대 워커 수 이상)
+SHARED_SESSION_POOL_SIZE = 32
+
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session():
+    """
+    모듈 공용 HTTP 세션 반환 (처음 호출 시 생성)
+    
+    다운로더 인스턴스마다 세션을 새로 만들면 TCP/TLS 연결을 매번 다시 맺으므로
+    모든 다운로더가 하나의 연결 풀을 공유함
+    
+    Returns:
+        requests.Session: 연결 풀과 재시도가 설정된 세션
+    """
+    global _shared_session
+    
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = create_http_session(pool_size=SHARED_SESSION_POOL_SIZE)
+        
+        return _shared_session
+
 
 class ThumbnailDownloader:
     """썸네일 다운로드 클래스"""
     
-    def __init__(self, output_dir="thumbnails", max_workers=5):
+    def __init__(self, output_dir="thumbnails", max_workers=5, session=None):
         """
         썸네일 다운로더 초기화
         
         Args:
             output_dir (str): 출력 디렉토리
             max_workers (int): 병렬 다운로드 워커 수
+            session (requests.Session): 재사용할 HTTP 세션 (없으면 모듈 공용 세션 사용)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
         self.max_workers = max_workers
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        
+        if session is not None:
+            self.session = session
+        elif max_workers <= SHARED_SESSION_POOL_SIZE:
+            # 공용 세션의 연결 풀이 워커 수보다 크면 함께 사용
+            self.session = get_shared_session()
+        else:
+            # 연결 풀 크기를 워커 수에 맞춤 (풀보다 많은 워커의 연결이 버려지지 않도록)
+            self.session = create_http_session(pool_size=max_workers)
         
         # 다운로드 통계
         self.stats = {
@@ -42,6 +85,7 @@ class ThumbnailDownloader:
             'failed_downloads': 0,
             'skipped_existing': 0
         }
+        self._stats_lock = threading.Lock()  # 병렬 워커 간 통계 갱신 보호
         
         print(f"✅ 썸네일 다운로더 초기화 완료 (출력: {self.output_dir})")
     
@@ -74,7 +118,7 @@ class ThumbnailDownloader:
             
             # 이미 존재하는지 확인
             if filepath.exists():
-                self.stats['skipped_existing'] += 1
+                self._increment_stat('skipped_existing')
                 return {
                     'success': True,
                     'filepath': str(filepath),
@@ -86,18 +130,18 @@ class ThumbnailDownloader:
             result = self._download_and_save(thumbnail_url, filepath, resize)
             
             if result['success']:
-                self.stats['successful_downloads'] += 1
+                self._increment_stat('successful_downloads')
             else:
-                self.stats['failed_downloads'] += 1
+                self._increment_stat('failed_downloads')
             
             return result
             
         except Exception as e:
-            self.stats['failed_downloads'] += 1
+            self._increment_stat('failed_downloads')
             return {'success': False, 'error': f'다운로드 오류: {str(e)}'}
     
     def download_multiple_thumbnails(self, videos_data, quality='high', resize=None, 
-                                   add_rank=True, create_zip=True):
+                                   add_rank=True, create_zip=True, progress_callback=None):
         """
         여러 영상의 썸네일 일괄 다운로드
         
@@ -107,6 +151,7 @@ class ThumbnailDownloader:
             resize (tuple): 리사이즈 크기
             add_rank (bool): 순위 추가 여부
             create_zip (bool): ZIP 파일 생성 여부
+            progress_callback (callable): 진행 상황 콜백 (완료 수, 전체 수), 작업 스레드에서 호출됨
             
         Returns:
             dict: 일괄 다운로드 결과
@@ -156,6 +201,10 @@ class ThumbnailDownloader:
                     if i % 10 == 0 or i == len(videos_data):
                         progress = (i / len(videos_data)) * 100
                         print(f"   진행률: {progress:.1f}% ({i}/{len(videos_data)})")
+                    
+                    # 화면 진행 표시는 완료될 때마다 갱신
+                    if progress_callback:
+                        progress_callback(i, len(videos_data))
                 
                 except Exception as e:
                     failed_videos.append({
@@ -247,19 +296,12 @@ class ThumbnailDownloader:
         try:
             thumbnails = video_data.get('snippet', {}).get('thumbnails', {})
             
-            # 품질 우선순위 설정
-            quality_priority = {
-                'maxres': ['maxres', 'high', 'medium', 'default'],
-                'high': ['high', 'medium', 'default'],
-                'medium': ['medium', 'default', 'high'],
-                'default': ['default', 'medium', 'high']
-            }
-            
-            priorities = quality_priority.get(preferred_quality, quality_priority['high'])
+            priorities = THUMBNAIL_QUALITY_PRIORITY.get(preferred_quality, THUMBNAIL_QUALITY_PRIORITY['high'])
             
             for quality in priorities:
-                if quality in thumbnails and 'url' in thumbnails[quality]:
-                    return thumbnails[quality]['url']
+                url = thumbnails.get(quality, {}).get('url')
+                if url:
+                    return url
             
             return None
             
@@ -308,36 +350,59 @@ class ThumbnailDownloader:
         
         return safe_filename
     
+    def _increment_stat(self, key):
+        """다운로드 통계 증가 (스레드 안전)"""
+        with self._stats_lock:
+            self.stats[key] += 1
+    
     def _download_and_save(self, url, filepath, resize=None):
         """실제 다운로드 및 저장"""
         try:
             # HTTP 요청
-            response = self.session.get(url, timeout=config.THUMBNAIL_DOWNLOAD_TIMEOUT)
+            response = self.session.get(url, timeout=config.THUMBNAIL_DOWNLOAD_TIMEOUT, stream=True)
             response.raise_for_status()
             
-            # 이미지 처리
-            image_data = BytesIO(response.content)
-            image = Image.open(image_data)
-            
-            # 리사이즈 (필요한 경우)
-            if resize:
-                image = image.resize(resize, Image.Resampling.LANCZOS)
-            
-            # 파일 저장
-            image.save(filepath, 'JPEG', quality=95, optimize=True)
+            # 오류 페이지(HTML 등)를 .jpg로 저장하지 않도록 응답 형식 확인
+            content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+            if not content_type.startswith('image/'):
+                response.close()
+                return {'success': False, 'error': f'이미지가 아닌 응답: {content_type or "알 수 없음"}'}
+            
+            if resize or content_type != 'image/jpeg':
+                # 리사이즈가 필요하거나 JPEG가 아닌 경우(WebP 등)에만 디코딩 후 JPEG로 재인코딩
+                image = Image.open(BytesIO(response.content))
+                if resize:
+                    image = image.resize(resize, Image.Resampling.LANCZOS)
+                if image.mode != 'RGB':
+                    image = image.convert('RGB')
+                image.save(filepath, 'JPEG', quality=95, optimize=True)
+                image_size = image.size
+            else:
+                # 원본 JPEG는 디코딩 없이 버퍼링된 스트림으로 그대로 저장
+                with open(filepath, 'wb', buffering=1 << 20) as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
+                
+                # 크기 정보는 헤더만 읽어서 확인 (읽을 수 없는 파일이면 아래에서 삭제)
+                with Image.open(filepath) as image:
+                    image_size = image.size
             
             return {
                 'success': True,
                 'filepath': str(filepath),
                 'file_size': filepath.stat().st_size,
-                'image_size': image.size
+                'image_size': image_size
             }
             
+        # 실패한 파일이 다음 실행에서 '이미 존재'로 건너뛰어지지 않도록 삭제
         except requests.exceptions.Timeout:
+            filepath.unlink(missing_ok=True)
             return {'success': False, 'error': '다운로드 타임아웃'}
         except requests.exceptions.RequestException as e:
+            filepath.unlink(missing_ok=True)
             return {'success': False, 'error': f'네트워크 오류: {str(e)}'}
         except Exception as e:
+            filepath.unlink(missing_ok=True)
             return {'success': False, 'error': f'이미지 처리 오류: {str(e)}'}
     
     def _create_zip_file(self, file_paths):
@@ -739,15 +804,13 @@ def download_top_performers_thumbnails(videos_data, top_count=10, output_dir="to
     Returns:
         dict: 다운로드 결과
     """
-    # Outlier Score 기준으로 정렬
-    sorted_videos = sorted(
-        videos_data, 
-        key=lambda x: x.get('analysis', {}).get('outlier_score', 0), 
-        reverse=True
+    # Outlier Score 기준 상위 영상 선택 (전체 정렬 없이 상위 개수만)
+    top_videos = heapq.nlargest(
+        top_count,
+        videos_data,
+        key=lambda x: x.get('analysis', {}).get('outlier_score', 0)
     )
     
-    top_videos = sorted_videos[:top_count]
-    
     downloader = ThumbnailDownloader(output_dir)
     return downloader.download_multiple_thumbnails(top_videos, quality='maxres', add_rank=True)
 
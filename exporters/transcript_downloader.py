@@ -5,10 +5,11 @@ YouTube 영상 대본 추출, 자막 다운로드, 텍스트 처리 담당
 
 import os
 import re
-import time
+import heapq
 import json
 import subprocess
 import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional
@@ -39,7 +40,7 @@ class TranscriptDownloader:
         
         Args:
             output_dir (str): 출력 디렉토리
-            whisper_model (str): Whisper 모델 크기 ("tiny", "base", "small", "medium", "large")
+            whisper_model (str): Whisper 모델 크기 ("tiny", "base", "small", "medium", "large", None이면 로드하지 않음)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
@@ -49,7 +50,7 @@ class TranscriptDownloader:
         
         # Whisper 모델 로드 (선택사항)
         self.whisper_model = None
-        if WHISPER_AVAILABLE:
+        if WHISPER_AVAILABLE and whisper_model:
             try:
                 print(f"🤖 Whisper 모델 로드 중: {whisper_model}")
                 self.whisper_model = whisper.load_model(whisper_model)
@@ -74,6 +75,7 @@ class TranscriptDownloader:
             'failed_downloads': 0,
             'method_used': {}
         }
+        self._stats_lock = threading.Lock()  # 병렬 워커 간 통계 갱신 보호
         
         print(f"✅ 대본 다운로더 초기화 완료")
         print(f"   사용 가능한 방법: {self._get_available_methods()}")
@@ -145,7 +147,8 @@ class TranscriptDownloader:
             return result
     
     def download_multiple_transcripts(self, video_ids: List[str], languages: List[str] = ['ko', 'en'],
-                                    output_format='text', use_whisper=False, max_workers=3):
+                                    output_format='text', use_whisper=False, max_workers=3,
+                                    progress_callback=None):
         """
         여러 영상의 대본 일괄 다운로드
         
@@ -154,7 +157,8 @@ class TranscriptDownloader:
             languages (list): 선호 언어 목록
             output_format (str): 출력 형식
             use_whisper (bool): Whisper 사용 여부
-            max_workers (int): 병렬 처리 워커 수
+            max_workers (int): 병렬 처리 워커 수 (동시 요청 수 제한)
+            progress_callback (callable): 진행 상황 콜백 (완료 수, 전체 수), 작업 스레드에서 호출됨
             
         Returns:
             dict: 일괄 다운로드 결과
@@ -195,15 +199,16 @@ class TranscriptDownloader:
                         progress = (i / len(video_ids)) * 100
                         print(f"   진행률: {progress:.1f}% ({i}/{len(video_ids)})")
                     
-                    # API 요청 제한 고려 (짧은 대기)
-                    time.sleep(0.5)
-                    
                 except Exception as e:
                     failed_downloads.append({
                         'success': False,
                         'video_id': video_id,
                         'error': str(e)
                     })
+                
+                # 요청 속도는 워커 수로 제한하므로 결과 수집 중에는 대기하지 않음
+                if progress_callback:
+                    progress_callback(i, len(video_ids))
         
         # 결과 정리
         result = {
@@ -604,16 +609,17 @@ class TranscriptDownloader:
         return methods
     
     def _update_stats(self, method: str, success: bool):
-        """통계 업데이트"""
-        if method not in self.stats['method_used']:
-            self.stats['method_used'][method] = 0
-        
-        self.stats['method_used'][method] += 1
-        
-        if success:
-            self.stats['successful_downloads'] += 1
-        else:
-            self.stats['failed_downloads'] += 1
+        """통계 업데이트 (병렬 워커에서 호출되므로 잠금 사용)"""
+        with self._stats_lock:
+            if method not in self.stats['method_used']:
+                self.stats['method_used'][method] = 0
+            
+            self.stats['method_used'][method] += 1
+            
+            if success:
+                self.stats['successful_downloads'] += 1
+            else:
+                self.stats['failed_downloads'] += 1
     
     def get_stats(self) -> Dict:
         """통계 반환"""
@@ -726,7 +732,7 @@ def extract_transcript_keywords(transcript_files: List[str], language='ko'):
         trending_keywords = analyzer.find_trending_keywords(all_texts)
         
         # 고빈도 키워드 추출 (상위 20개)
-        top_keywords = sorted(keyword_freq.items(), key=lambda x: x[1], reverse=True)[:20]
+        top_keywords = heapq.nlargest(20, keyword_freq.items(), key=lambda x: x[1])
         
         # 키워드 클러스터링
         keyword_clusters = analyzer.cluster_similar_keywords([kw[0] for kw in top_keywords])
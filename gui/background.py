@@ -0,0 +1,171 @@
+"""
+gui/background.py
+GUI 탭/창에서 공통으로 쓰는 백그라운드 작업 도우미
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import messagebox
+
+# 반복 진행률 업데이트 최소 간격 (초, 최대 10Hz)
+PROGRESS_UPDATE_INTERVAL = 0.1
+
+
+class CancellableThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    대기 중인 작업을 취소하고 종료할 수 있는 스레드 풀
+    
+    shutdown(cancel_futures=True)는 Python 3.9 이상에서만 지원되므로
+    제출된 Future를 직접 추적해 Python 3.8에서도 같은 동작을 제공
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending_futures = set()
+        self._pending_lock = threading.Lock()
+    
+    def submit(self, fn, *args, **kwargs):
+        """작업 제출 (완료될 때까지 Future를 추적)"""
+        future = super().submit(fn, *args, **kwargs)
+        with self._pending_lock:
+            self._pending_futures.add(future)
+        future.add_done_callback(self._forget_future)
+        return future
+    
+    def _forget_future(self, future):
+        """완료/취소된 Future를 추적 목록에서 제거"""
+        with self._pending_lock:
+            self._pending_futures.discard(future)
+    
+    def shutdown_now(self):
+        """아직 시작하지 않은 작업은 취소하고, 실행 중인 작업을 기다리지 않고 종료"""
+        with self._pending_lock:
+            pending = list(self._pending_futures)
+        
+        for future in pending:
+            future.cancel()  # 이미 실행 중인 작업은 취소되지 않음
+        
+        self.shutdown(wait=False)
+
+
+class ThrottledProgressMixin:
+    """
+    작업 스레드에서 호출해도 안전한 진행률 업데이트 믹스인
+    
+    사용하는 클래스는 self.parent, self.progress_var, self.progress_text_var를
+    가지고 있어야 하며, __init__에서 _init_progress_state()를 호출해야 함
+    """
+    
+    def _init_progress_state(self):
+        """진행률 반영용 상태 초기화"""
+        self._last_progress_ts = 0.0
+        self._pending_progress = None  # 메인 스레드에 반영 대기 중인 (값, 문구)
+        self._progress_lock = threading.Lock()
+    
+    def update_progress(self, value, text, throttle=False):
+        """진행률 업데이트 (throttle=True면 최소 간격 내 반복 호출은 건너뜀)"""
+        if throttle:
+            now = time.monotonic()
+            if now - self._last_progress_ts < PROGRESS_UPDATE_INTERVAL:
+                return
+            self._last_progress_ts = now
+        
+        # 최신 값만 남기고, 반영 예약은 한 번만 걸어 둠 (작업 스레드에서도 호출 가능)
+        with self._progress_lock:
+            already_scheduled = self._pending_progress is not None
+            self._pending_progress = (value, text)
+        
+        if not already_scheduled:
+            self.parent.after(0, self._flush_progress)
+    
+    def _flush_progress(self):
+        """대기 중인 진행률을 메인 스레드에서 위젯에 반영"""
+        with self._progress_lock:
+            pending = self._pending_progress
+            self._pending_progress = None
+        
+        if pending is None:
+            return
+        
+        value, text = pending
+        self.progress_var.set(value)
+        self.progress_text_var.set(text)
+
+
+def run_in_background(executor, widget, worker, on_done):
+    """
+    worker를 작업 스레드 풀에서 실행하고 결과를 UI 스레드의 on_done으로 전달
+    
+    Args:
+        executor (ThreadPoolExecutor): 작업을 실행할 스레드 풀
+        widget: after()로 UI 스레드에 결과를 넘길 위젯
+        worker (callable): 인자 없이 호출되어 결과 dict를 반환하는 함수
+        on_done (callable): 결과 dict를 받는 완료 콜백 (UI 스레드에서 호출)
+        
+    Returns:
+        Future: 제출된 작업
+    """
+    def task():
+        try:
+            result = worker()
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+        
+        # 결과 표시는 UI 스레드에서
+        widget.after(0, on_done, result)
+    
+    return executor.submit(task)
+
+
+def show_task_result(result, action, set_status, build_message):
+    """
+    백그라운드 작업 결과를 상태 문구와 메시지 박스로 표시 (UI 스레드)
+    
+    Args:
+        result (dict): 'success'와 실패 시 'error'를 담은 작업 결과
+        action (str): 작업 이름 (예: "썸네일 다운로드")
+        set_status (callable): 상태 문구를 표시하는 함수
+        build_message (callable): result를 받아 (상태 문구, 창 제목, 메시지)를 반환하는 함수
+        
+    Returns:
+        bool: 작업 성공 여부
+    """
+    if not result.get('success'):
+        set_status(f"{action} 실패")
+        messagebox.showerror("오류", f"{action} 중 오류가 발생했습니다:\n{result.get('error', '')}")
+        return False
+    
+    status, title, message = build_message(result)
+    set_status(status)
+    messagebox.showinfo(title, message)
+    return True
+
+
+def download_result_message(label, output_dir):
+    """다운로드 결과 요약을 만드는 build_message 함수 생성 (label: "썸네일", "자막" 등)"""
+    def build(result):
+        summary = result['summary']
+        lines = [
+            f"성공: {summary['successful_downloads']}개",
+            f"실패: {summary['failed_downloads']}개"
+        ]
+        if 'skipped_existing' in summary:
+            lines.append(f"건너뜀: {summary['skipped_existing']}개")
+        
+        return (
+            f"✅ {label} {summary['successful_downloads']}개 다운로드 완료",
+            "다운로드 완료",
+            "\n".join(lines) + f"\n\n저장 위치: {output_dir}"
+        )
+    
+    return build
+
+
+def excel_result_message(result):
+    """엑셀 내보내기 결과 메시지 (show_task_result의 build_message용)"""
+    return (
+        f"✅ 엑셀 저장 완료: {result['filename']}",
+        "내보내기 완료",
+        f"엑셀 파일이 저장되었습니다.\n\n{result['filename']}"
+    )
@@ -6,20 +6,83 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import webbrowser
-import threading
 from datetime import datetime
+from functools import partial
 import os
 
+from core.youtube_client import format_duration_text
+from exporters import ThumbnailDownloader, TranscriptDownloader, quick_excel_export
+from .background import CancellableThreadPoolExecutor, run_in_background, show_task_result, download_result_message, excel_result_message
+from .results_viewer import insert_tree_rows
+from utils import truncate_string
+from utils.cache_manager import load_json_cache, save_json_cache
+
 # 이미지 처리를 위한 import (선택적)
 try:
     from PIL import Image, ImageTk
-    import requests
     from io import BytesIO
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
     print("⚠️ PIL/Pillow가 설치되지 않았습니다. 썸네일 표시가 제한됩니다.")
 
+# 최근 영상 목록 디스크 캐시 유효 시간 (6시간)
+CHANNEL_VIDEOS_CACHE_TTL = 6 * 60 * 60
+
+# 모든 상세 창이 공유하는 백그라운드 I/O 스레드 풀 (창을 열 때마다 스레드를 만들지 않음)
+_io_executor = CancellableThreadPoolExecutor(max_workers=4, thread_name_prefix='channel-detail-io')
+
+# 영상 썸네일 일괄 다운로드 최대 워커 수
+THUMBNAIL_DOWNLOAD_WORKERS = 16
+
+# 자막 일괄 다운로드 워커 수 (YouTube 요청 제한을 고려해 작게 유지)
+TRANSCRIPT_DOWNLOAD_WORKERS = 8
+
+
+def shutdown_io_executor():
+    """상세 창 공유 I/O 스레드 풀 정리 (애플리케이션 종료 시 호출)"""
+    _io_executor.shutdown_now()
+
+
+def format_count(number):
+    """숫자 포맷팅 (천 단위 구분, 문자열 숫자 허용)"""
+    try:
+        if isinstance(number, str):
+            number = int(number)
+        return f"{number:,}"
+    except (ValueError, TypeError):
+        return str(number)
+
+
+def build_video_row(video):
+    """
+    최근 영상 테이블 행 값 생성 (Tk를 사용하지 않으므로 작업 스레드에서 미리 호출 가능)
+    
+    Args:
+        video (dict): YouTube API 영상 데이터
+        
+    Returns:
+        tuple: 테이블 컬럼 순서의 행 값 (video['_row_values']에도 보관)
+    """
+    cached = video.get('_row_values')
+    if cached is not None:
+        return cached
+    
+    snippet = video.get('snippet', {})
+    statistics = video.get('statistics', {})
+    duration = video.get('contentDetails', {}).get('duration', '')
+    
+    values = (
+        truncate_string(snippet.get('title', ''), 40),
+        format_count(statistics.get('viewCount', 0)),
+        format_count(statistics.get('likeCount', 0)),
+        format_count(statistics.get('commentCount', 0)),
+        snippet.get('publishedAt', '')[:10],
+        format_duration_text(duration) if duration else "00:00"
+    )
+    video['_row_values'] = values
+    return values
+
 class ChannelDetailWindow:
     """채널 상세 정보 창"""
     
@@ -28,6 +91,12 @@ class ChannelDetailWindow:
         self.channel_data = channel_data
         self.youtube_client = youtube_client
         
+        # 영상 테이블 아이템 ID -> 영상 ID (클릭 시 Tcl 조회 없이 사용)
+        self.row_video_ids = {}
+        
+        # 최근 영상 목록 (일괄 다운로드/내보내기에 사용)
+        self.recent_videos = []
+        
         # 새 창 생성
         self.window = tk.Toplevel(parent)
         self.setup_window()
@@ -148,7 +217,7 @@ class ChannelDetailWindow:
         # 채널 설명 (요약)
         description = snippet.get('description', '')
         if description:
-            short_desc = description[:200] + "..." if len(description) > 200 else description
+            short_desc = truncate_string(description, 200)
             desc_label = tk.Label(
                 details_frame,
                 text=f"설명: {short_desc}",
@@ -355,6 +424,17 @@ class ChannelDetailWindow:
                 fg='#86868b'
             )
             desc_label.pack(side='left', padx=(15, 0), anchor='w')
+        
+        # 다운로드 진행 상황 표시
+        self.download_status_var = tk.StringVar(value="")
+        status_label = tk.Label(
+            download_container,
+            textvariable=self.download_status_var,
+            font=('SF Pro Display', 11),
+            bg='#f5f5f7',
+            fg='#1d1d1f'
+        )
+        status_label.pack(pady=(20, 0), anchor='w')
             
     def create_action_buttons(self, parent):
         """하단 액션 버튼들"""
@@ -417,12 +497,12 @@ class ChannelDetailWindow:
             
     def load_thumbnail(self):
         """채널 썸네일 로드"""
+        if not PIL_AVAILABLE:
+            self.thumbnail_label.config(text="썸네일\n(PIL 필요)", bg='#e5e5e7')
+            return
+        
         def load_in_background():
             try:
-                if not PIL_AVAILABLE:
-                    self.thumbnail_label.config(text="썸네일\n(PIL 필요)", bg='#e5e5e7')
-                    return
-                
                 thumbnail_url = self.channel_data.get('snippet', {}).get('thumbnails', {}).get('high', {}).get('url')
                 if not thumbnail_url:
                     # medium이나 default 시도
@@ -430,15 +510,16 @@ class ChannelDetailWindow:
                     thumbnail_url = thumbnails.get('medium', {}).get('url') or thumbnails.get('default', {}).get('url')
                 
                 if thumbnail_url:
-                    response = requests.get(thumbnail_url, timeout=5)
+                    response = self.youtube_client.session.get(thumbnail_url, timeout=5)
                     response.raise_for_status()
                     
+                    # 디코딩과 리사이즈는 백그라운드 스레드에서 처리
                     img = Image.open(BytesIO(response.content))
-                    img = img.resize((120, 120), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(img)
+                    img.draft('RGB', (120, 120))  # JPEG는 축소 디코딩
+                    img = img.convert('RGB').resize((120, 120), Image.Resampling.LANCZOS)
                     
-                    # UI 스레드에서 업데이트
-                    self.window.after(0, lambda: self.update_thumbnail(photo))
+                    # PhotoImage 생성은 UI 스레드에서
+                    self.window.after(0, lambda: self.update_thumbnail(img))
                 else:
                     self.window.after(0, lambda: self.thumbnail_label.config(text="썸네일\n없음", bg='#e5e5e7'))
                     
@@ -447,18 +528,28 @@ class ChannelDetailWindow:
                 self.window.after(0, lambda: self.thumbnail_label.config(text="썸네일\n로드 실패", bg='#e5e5e7'))
         
         # 백그라운드에서 로드
-        threading.Thread(target=load_in_background, daemon=True).start()
+        _io_executor.submit(load_in_background)
     
-    def update_thumbnail(self, photo):
+    def update_thumbnail(self, img):
         """썸네일 업데이트 (UI 스레드에서 호출)"""
         try:
+            photo = ImageTk.PhotoImage(img)
             self.thumbnail_label.config(image=photo, text="")
             self.thumbnail_label.image = photo  # 참조 유지
         except Exception as e:
             print(f"썸네일 업데이트 오류: {e}")
             
     def load_recent_videos(self):
-        """최근 영상 로드"""
+        """최근 영상 로드 (디스크 캐시 우선)"""
+        channel_id = self.channel_data.get('id')
+        
+        # 캐시된 목록이 있으면 API 호출 없이 바로 표시
+        cached_videos = load_json_cache('channel_videos', channel_id, CHANNEL_VIDEOS_CACHE_TTL) if channel_id else None
+        if cached_videos:
+            print(f"📦 채널 {channel_id}의 최근 영상 캐시 사용")
+            self.update_videos_table(cached_videos)
+            return
+        
         def load_in_background():
             try:
                 channel_id = self.channel_data.get('id')
@@ -497,6 +588,13 @@ class ChannelDetailWindow:
                 videos_response = videos_request.execute()
                 videos = videos_response.get('items', [])
                 
+                # 다음 창 열기를 위해 캐시 저장
+                save_json_cache('channel_videos', channel_id, videos)
+                
+                # 표시 문자열은 작업 스레드에서 미리 한 번만 생성 (캐시 저장 후 추가해 디스크에는 남기지 않음)
+                for video in videos:
+                    build_video_row(video)
+                
                 # UI 업데이트
                 self.window.after(0, lambda: self.update_videos_table(videos))
                 
@@ -504,39 +602,32 @@ class ChannelDetailWindow:
                 print(f"최근 영상 로드 오류: {e}")
         
         # 백그라운드에서 로드
-        threading.Thread(target=load_in_background, daemon=True).start()
+        _io_executor.submit(load_in_background)
     
     def update_videos_table(self, videos):
         """영상 테이블 업데이트 (UI 스레드에서 호출)"""
         try:
+            # 일괄 삽입 동안 테이블을 숨겨 행마다 다시 그리지 않도록 함
+            self.videos_tree.grid_remove()
+            
             # 기존 데이터 삭제
-            for item in self.videos_tree.get_children():
-                self.videos_tree.delete(item)
-            
-            # 새 데이터 추가
-            for video in videos:
-                snippet = video.get('snippet', {})
-                statistics = video.get('statistics', {})
-                content_details = video.get('contentDetails', {})
-                
-                title = snippet.get('title', '')[:40] + "..." if len(snippet.get('title', '')) > 40 else snippet.get('title', '')
-                views = self.format_number(statistics.get('viewCount', 0))
-                likes = self.format_number(statistics.get('likeCount', 0))
-                comments = self.format_number(statistics.get('commentCount', 0))
-                published = snippet.get('publishedAt', '')[:10]
-                
-                # 영상 길이 파싱
-                duration = content_details.get('duration', '')
-                formatted_duration = self.parse_duration(duration)
-                
-                self.videos_tree.insert('', 'end', values=(
-                    title, views, likes, comments, published, formatted_duration
-                ), tags=(video['id'],))  # video_id를 태그로 저장
+            self.videos_tree.delete(*self.videos_tree.get_children())
+            self.row_video_ids.clear()
+            self.recent_videos = list(videos)
+            
+            # 행 값을 먼저 모두 만든 뒤 삽입 (영상별로 한 번 만든 표시 값 재사용)
+            rows = [(video['id'], build_video_row(video)) for video in videos]
+            
+            # 새 데이터 추가 (한 번의 Tcl 호출로 모든 행 삽입)
+            item_ids = insert_tree_rows(self.videos_tree, [values for _, values in rows])
+            self.row_video_ids.update(zip(item_ids, (video_id for video_id, _ in rows)))
                 
             print(f"✅ {len(videos)}개 영상 목록 업데이트 완료")
             
         except Exception as e:
             print(f"영상 테이블 업데이트 오류: {e}")
+        finally:
+            self.videos_tree.grid()
     
     def on_video_double_click(self, event):
         """영상 더블클릭 시 YouTube에서 열기"""
@@ -545,11 +636,9 @@ class ChannelDetailWindow:
             if not selection:
                 return
             
-            item = self.videos_tree.item(selection[0])
-            tags = item.get('tags', [])
+            video_id = self.row_video_ids.get(selection[0])
             
-            if tags:
-                video_id = tags[0]
+            if video_id:
                 url = f"https://www.youtube.com/watch?v={video_id}"
                 webbrowser.open(url)
             else:
@@ -579,9 +668,8 @@ class ChannelDetailWindow:
             )
             
             if filename:
-                # 다운로드 실행
-                import requests
-                response = requests.get(thumbnail_url, timeout=10)
+                # 다운로드 실행 (클라이언트의 공유 세션 사용)
+                response = self.youtube_client.session.get(thumbnail_url, timeout=10)
                 response.raise_for_status()
                 
                 with open(filename, 'wb') as f:
@@ -595,16 +683,141 @@ class ChannelDetailWindow:
         
     def download_video_thumbnails(self):
         """최근 영상 썸네일 일괄 다운로드"""
-        messagebox.showinfo("준비 중", "영상 썸네일 일괄 다운로드 기능을 준비 중입니다.")
-        
+        try:
+            if not self.recent_videos:
+                messagebox.showwarning("경고", "다운로드할 영상이 없습니다.")
+                return
+            
+            output_dir = filedialog.askdirectory(title="썸네일 저장 폴더 선택")
+            if not output_dir:
+                return
+            
+            videos = list(self.recent_videos)
+            self.download_status_var.set(f"🖼️ {len(videos)}개 썸네일 다운로드 중...")
+            
+            # 영상별 요청을 병렬 다운로더로 처리 (UI 스레드를 막지 않도록 백그라운드에서 실행)
+            run_in_background(
+                _io_executor,
+                self.window,
+                partial(self._download_video_thumbnails_worker, videos, output_dir),
+                partial(
+                    show_task_result,
+                    action="썸네일 다운로드",
+                    set_status=self.download_status_var.set,
+                    build_message=download_result_message("썸네일", output_dir)
+                )
+            )
+            
+        except Exception as e:
+            print(f"썸네일 일괄 다운로드 오류: {e}")
+            messagebox.showerror("오류", f"썸네일 다운로드 중 오류가 발생했습니다:\n{str(e)}")
+    
+    def _download_video_thumbnails_worker(self, videos, output_dir):
+        """썸네일 병렬 다운로드 (백그라운드 스레드)"""
+        # 클라이언트의 HTTP 세션을 공유해 연결 재사용
+        downloader = ThumbnailDownloader(
+            output_dir,
+            max_workers=min(THUMBNAIL_DOWNLOAD_WORKERS, len(videos)),
+            session=getattr(self.youtube_client, 'session', None)
+        )
+        return downloader.download_multiple_thumbnails(
+            videos,
+            add_rank=False,
+            create_zip=False,
+            progress_callback=self._report_download_progress
+        )
+    
+    def _report_download_progress(self, done, total):
+        """다운로드 진행 상황 표시 (작업 스레드에서 호출)"""
+        self.window.after(0, self.download_status_var.set, f"📥 다운로드 중... ({done}/{total} 완료)")
+    
     def download_subtitles(self):
         """자막 일괄 다운로드"""
-        messagebox.showinfo("준비 중", "자막 일괄 다운로드 기능을 준비 중입니다.")
-        
+        try:
+            if not self.recent_videos:
+                messagebox.showwarning("경고", "다운로드할 영상이 없습니다.")
+                return
+            
+            output_dir = filedialog.askdirectory(title="자막 저장 폴더 선택")
+            if not output_dir:
+                return
+            
+            video_ids = [video['id'] for video in self.recent_videos]
+            self.download_status_var.set(f"📝 {len(video_ids)}개 영상 자막 다운로드 중...")
+            
+            run_in_background(
+                _io_executor,
+                self.window,
+                partial(self._download_subtitles_worker, video_ids, output_dir),
+                partial(
+                    show_task_result,
+                    action="자막 다운로드",
+                    set_status=self.download_status_var.set,
+                    build_message=download_result_message("자막", output_dir)
+                )
+            )
+            
+        except Exception as e:
+            print(f"자막 일괄 다운로드 오류: {e}")
+            messagebox.showerror("오류", f"자막 다운로드 중 오류가 발생했습니다:\n{str(e)}")
+    
+    def _download_subtitles_worker(self, video_ids, output_dir):
+        """자막 병렬 다운로드 (백그라운드 스레드)"""
+        # 자막 추출만 하므로 Whisper 모델은 로드하지 않음
+        downloader = TranscriptDownloader(output_dir, whisper_model=None)
+        return downloader.download_multiple_transcripts(
+            video_ids,
+            max_workers=min(TRANSCRIPT_DOWNLOAD_WORKERS, len(video_ids)),
+            progress_callback=self._report_download_progress
+        )
+    
     def export_to_excel(self):
         """엑셀로 내보내기"""
-        messagebox.showinfo("준비 중", "엑셀 내보내기 기능을 준비 중입니다.")
-        
+        try:
+            if not self.recent_videos:
+                messagebox.showwarning("경고", "내보낼 영상이 없습니다.")
+                return
+            
+            channel_name = self.channel_data.get('snippet', {}).get('title', 'channel')
+            safe_name = "".join(c for c in channel_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            
+            filename = filedialog.asksaveasfilename(
+                title="엑셀 파일 저장",
+                defaultextension=".xlsx",
+                initialfile=f"{safe_name}_{timestamp}.xlsx",
+                filetypes=[("Excel 파일", "*.xlsx")]
+            )
+            if not filename:
+                return
+            
+            settings = {
+                'mode': 'channel',
+                'mode_name': f"채널 분석 ({channel_name})"
+            }
+            self.download_status_var.set("📊 엑셀 저장 중...")
+            
+            # 시트 생성은 오래 걸리므로 창이 멈추지 않도록 백그라운드에서 실행
+            run_in_background(
+                _io_executor,
+                self.window,
+                partial(self._export_excel_worker, list(self.recent_videos), settings, filename),
+                partial(
+                    show_task_result,
+                    action="엑셀 내보내기",
+                    set_status=self.download_status_var.set,
+                    build_message=excel_result_message
+                )
+            )
+            
+        except Exception as e:
+            print(f"엑셀 내보내기 오류: {e}")
+            messagebox.showerror("오류", f"엑셀 내보내기 중 오류가 발생했습니다:\n{str(e)}")
+    
+    def _export_excel_worker(self, videos, settings, filename):
+        """엑셀 파일 생성 (백그라운드 스레드)"""
+        return {'success': True, 'filename': quick_excel_export(videos, settings, filename)}
+    
     def start_channel_analysis(self):
         """채널 분석 시작"""
         try:
@@ -666,38 +879,14 @@ class ChannelDetailWindow:
     # 유틸리티 메서드들
     def format_number(self, number):
         """숫자 포맷팅"""
-        try:
-            if isinstance(number, str):
-                number = int(number)
-            return f"{number:,}"
-        except (ValueError, TypeError):
-            return str(number)
+        return format_count(number)
     
     def parse_duration(self, duration):
         """YouTube duration 파싱 (PT1H2M3S -> 1:02:03)"""
         if not duration:
             return "00:00"
         
-        try:
-            import re
-            pattern = r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?'
-            match = re.match(pattern, duration)
-            
-            if not match:
-                return "00:00"
-            
-            hours = int(match.group(1) or 0)
-            minutes = int(match.group(2) or 0)
-            seconds = int(match.group(3) or 0)
-            
-            if hours > 0:
-                return f"{hours}:{minutes:02d}:{seconds:02d}"
-            else:
-                return f"{minutes}:{seconds:02d}"
-                
-        except Exception as e:
-            print(f"Duration 파싱 오류: {e}")
-            return "00:00"
+        return format_duration_text(duration)
 
 
 if __name__ == "__main__":
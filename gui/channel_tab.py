@@ -5,16 +5,18 @@ YouTube 채널 분석 인터페이스 담당
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
-import threading
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Core 모듈들
 from core import ChannelAnalyzer, YouTubeClient
+from core.youtube_client import CHANNEL_ID_PATTERN, CHANNEL_URL_PATTERN, CHANNEL_ID_SEARCH_FIELDS
 from data import create_analysis_suite
 from exporters import quick_excel_export, quick_thumbnail_download
+from .background import ThrottledProgressMixin
 
-class ChannelTab:
+class ChannelTab(ThrottledProgressMixin):
     """채널 분석 탭 클래스"""
     
     def __init__(self, parent, main_window):
@@ -30,8 +32,10 @@ class ChannelTab:
         
         # 분석 상태
         self.is_analyzing = False
+        self.current_future = None
         self.current_channel_data = None
         self.current_videos = []
+        self._init_progress_state()
         
         # YouTube 클라이언트
         self.youtube_client = None
@@ -335,9 +339,11 @@ class ChannelTab:
         )
         self.progress_bar.pack(fill='x', pady=(0, 5))
         
+        # 진행 문구는 StringVar로 연결 (갱신 시 위젯 재설정 없이 변수만 변경)
+        self.progress_text_var = tk.StringVar(value="준비 완료")
         self.progress_label = tk.Label(
             progress_frame,
-            text="준비 완료",
+            textvariable=self.progress_text_var,
             font=('SF Pro Display', 10),
             bg='#f5f5f7',
             fg='#86868b'
@@ -397,43 +403,58 @@ class ChannelTab:
             if not self.youtube_client:
                 self.youtube_client = YouTubeClient(api_key)
             
-            # 채널 검색
-            search_request = self.youtube_client.youtube.search().list(
-                part='snippet',
-                q=channel_name,
-                type='channel',
-                maxResults=10
-            )
-            search_response = search_request.execute()
-            
-            channels = search_response.get('items', [])
-            if not channels:
-                messagebox.showinfo("검색 결과 없음", f"'{channel_name}' 채널을 찾을 수 없습니다.")
-                self.update_progress(0, "준비 완료")
-                return
-            
-            # 채널 선택 다이얼로그
-            channel_options = []
-            for channel in channels:
-                title = channel['snippet']['title']
-                channel_id = channel['id']['channelId']
-                description = channel['snippet']['description'][:100] + "..." if len(channel['snippet']['description']) > 100 else channel['snippet']['description']
-                channel_options.append(f"{title} (ID: {channel_id})")
-            
-            # 선택 다이얼로그
-            selected = self.show_channel_selection_dialog(channel_options, channels)
-            if selected:
-                channel_url = f"https://www.youtube.com/channel/{selected['id']['channelId']}"
-                self.channel_var.set(channel_url)
-                messagebox.showinfo("채널 선택됨", f"채널이 선택되었습니다: {selected['snippet']['title']}")
-            
-            self.update_progress(0, "준비 완료")
+            # 검색 요청은 UI 스레드를 막지 않도록 작업 스레드 풀에서 실행
+            self.main_window.task_executor.submit(self._search_channel_worker, channel_name)
             
         except Exception as e:
             print(f"채널 검색 오류: {e}")
             messagebox.showerror("검색 오류", f"채널 검색 중 오류가 발생했습니다: {str(e)}")
             self.update_progress(0, "준비 완료")
     
+    def _search_channel_worker(self, channel_name):
+        """채널 검색 API 호출 (백그라운드 스레드)"""
+        try:
+            channels = self.youtube_client.search_channels(
+                channel_name,
+                max_results=10,
+                fields=CHANNEL_ID_SEARCH_FIELDS
+            )
+            result = {'success': True, 'channels': channels}
+            
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+        
+        # 결과 표시는 UI 스레드에서
+        self.parent.after(0, self._on_channel_search_done, channel_name, result)
+    
+    def _on_channel_search_done(self, channel_name, result):
+        """채널 검색 완료 처리 (UI 스레드)"""
+        self.update_progress(0, "준비 완료")
+        
+        if not result.get('success'):
+            print(f"채널 검색 오류: {result.get('error')}")
+            messagebox.showerror("검색 오류", f"채널 검색 중 오류가 발생했습니다: {result.get('error', '')}")
+            return
+        
+        channels = result['channels']
+        if not channels:
+            messagebox.showinfo("검색 결과 없음", f"'{channel_name}' 채널을 찾을 수 없습니다.")
+            return
+        
+        # 채널 선택 다이얼로그
+        channel_options = []
+        for channel in channels:
+            title = channel['snippet']['title']
+            channel_id = channel['id']['channelId']
+            channel_options.append(f"{title} (ID: {channel_id})")
+        
+        # 선택 다이얼로그
+        selected = self.show_channel_selection_dialog(channel_options, channels)
+        if selected:
+            channel_url = f"https://www.youtube.com/channel/{selected['id']['channelId']}"
+            self.channel_var.set(channel_url)
+            messagebox.showinfo("채널 선택됨", f"채널이 선택되었습니다: {selected['snippet']['title']}")
+    
     def show_channel_selection_dialog(self, options, channels):
         """채널 선택 다이얼로그"""
         dialog = tk.Toplevel(self.parent)
@@ -476,9 +497,9 @@ class ChannelTab:
         scrollbar.pack(side='right', fill='y')
         listbox.configure(yscrollcommand=scrollbar.set)
         
-        # 옵션 추가
-        for option in options:
-            listbox.insert(tk.END, option)
+        # 옵션 추가 (한 번의 Tcl 호출로 모두 삽입)
+        if options:
+            listbox.insert(tk.END, *options)
         
         # 버튼 프레임
         button_frame = tk.Frame(dialog, bg='#f5f5f7')
@@ -558,7 +579,7 @@ class ChannelTab:
                 return
             
             # 채널 정보 가져오기
-            channel_data = self.youtube_client.get_channel_info(channel_id)
+            channel_data = self.channel_analyzer.get_channel_info(channel_id)
             if not channel_data:
                 messagebox.showerror("채널 오류", "채널 정보를 가져올 수 없습니다.")
                 self.update_progress(0, "준비 완료")
@@ -613,13 +634,10 @@ class ChannelTab:
             'cache_enabled': self.cache_enabled_var.get()
         }
         
-        # 백그라운드에서 분석 실행
-        analysis_thread = threading.Thread(
-            target=self.execute_analysis,
-            args=(analysis_settings,),
-            daemon=True
+        # 메인 창의 작업 스레드 풀에서 분석 실행
+        self.current_future = self.main_window.task_executor.submit(
+            self.execute_analysis, analysis_settings
         )
-        analysis_thread.start()
     
     def execute_analysis(self, settings):
         """실제 분석 실행"""
@@ -646,43 +664,48 @@ class ChannelTab:
                 self.handle_analysis_error("유효하지 않은 채널 정보입니다.")
                 return
             
-            self.update_progress(20, "채널 기본 정보 로드 중...")
+            self.update_progress(20, "채널 정보 및 영상 목록 수집 중...")
+            
+            # 채널 정보와 영상 목록은 서로 독립적이므로 동시에 요청
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                channel_future = executor.submit(self.channel_analyzer.get_channel_info, channel_id)
+                videos_future = executor.submit(
+                    self.channel_analyzer.get_channel_videos,
+                    channel_id,
+                    max_results=settings['max_videos'],
+                    order=settings['sort_by']
+                )
+                channel_data = channel_future.result()
+                videos = videos_future.result()
             
-            # 채널 정보 가져오기
-            channel_data = self.youtube_client.get_channel_info(channel_id)
             if not channel_data:
                 self.handle_analysis_error("채널 정보를 가져올 수 없습니다.")
                 return
             
-            self.update_progress(40, "영상 목록 수집 중...")
-            
-            # 채널 영상 목록 가져오기
-            videos = self.channel_analyzer.get_channel_videos(
-                channel_id,
-                max_results=settings['max_videos'],
-                order=settings['sort_by']
-            )
-            
             if not videos:
                 self.handle_analysis_error("채널의 영상을 찾을 수 없습니다.")
                 return
             
             self.update_progress(60, f"{len(videos)}개 영상 분석 중...")
             
+            # 참여율/유형은 영상 목록 전체를 한 번에 계산
+            batch_metrics = self.analysis_suite['engagement_calculator'].calculate_batch_metrics(videos)
+            
             # 영상 분석
             analyzed_videos = []
-            for i, video in enumerate(videos):
+            total = len(videos)
+            for i, (video, metrics) in enumerate(zip(videos, batch_metrics)):
                 if not self.is_analyzing:  # 중지 체크
                     break
                 
                 # 간단한 분석 수행
-                analysis = self.analyze_single_video(video, i + 1)
+                analysis = self.analyze_single_video(video, i + 1, metrics)
                 video['analysis'] = analysis
                 analyzed_videos.append(video)
                 
                 # 진행률 업데이트
-                progress = 60 + (i / len(videos)) * 30
-                self.update_progress(progress, f"영상 분석 중... ({i+1}/{len(videos)})")
+                progress = 60 + (i / total) * 30
+                self.update_progress(progress, f"영상 분석 중... ({i+1}/{total})", throttle=True)
             
             if self.is_analyzing:
                 self.current_channel_data = channel_data
@@ -701,35 +724,15 @@ class ChannelTab:
             self.analyze_btn.config(state='normal')
             self.stop_btn.config(state='disabled')
     
-    def analyze_single_video(self, video, rank):
-        """개별 영상 분석"""
+    def analyze_single_video(self, video, rank, metrics):
+        """개별 영상 분석 (참여율/유형은 calculate_batch_metrics 결과 사용)"""
         try:
-            snippet = video['snippet']
-            statistics = video['statistics']
-            
-            # 기본 정보 추출
-            title = snippet.get('title', '')
-            views = int(statistics.get('viewCount', 0))
-            likes = int(statistics.get('likeCount', 0))
-            comments = int(statistics.get('commentCount', 0))
-            
-            # 참여도 계산
-            engagement_rate = 0
-            if views > 0:
-                engagement_rate = ((likes + comments) / views) * 100
-            
-            # 아웃라이어 점수 (간단한 계산)
-            outlier_score = min(engagement_rate * 10, 100)
-            
-            # 영상 유형 판별
-            duration = video.get('parsed_duration', '00:00')
-            video_type = '쇼츠' if ':' in duration and int(duration.split(':')[0]) == 0 and int(duration.split(':')[1]) <= 1 else '롱폼'
-            
             return {
                 'rank': rank,
-                'engagement_rate': engagement_rate,
-                'outlier_score': outlier_score,
-                'video_type': video_type
+                'engagement_rate': metrics['engagement_rate'],
+                'outlier_score': metrics['outlier_score'],
+                'views_per_day': metrics['views_per_day'],
+                'video_type': metrics['video_type']
             }
             
         except Exception as e:
@@ -758,6 +761,8 @@ class ChannelTab:
     def stop_analysis(self):
         """분석 중지"""
         self.is_analyzing = False
+        if self.current_future:
+            self.current_future.cancel()  # 아직 시작 전이면 실행 취소
         self.update_progress(0, "중지됨")
         print("🛑 사용자에 의해 분석이 중지되었습니다.")
     
@@ -779,12 +784,6 @@ class ChannelTab:
         messagebox.showerror("분석 오류", user_msg)
         self.update_progress(0, "오류 발생")
     
-    def update_progress(self, value, text):
-        """진행률 업데이트"""
-        self.progress_var.set(value)
-        self.progress_label.config(text=text)
-        self.parent.update_idletasks()
-    
     def set_channel_input(self, channel_url):
         """외부에서 채널 URL 설정 (결과 뷰어에서 호출)"""
         try:
@@ -807,31 +806,21 @@ class ChannelAnalyzerExtension:
     def extract_channel_id_from_url(self, url_or_input):
         """URL이나 입력에서 채널 ID 추출"""
         try:
-            import re
-            
             # 이미 채널 ID인 경우
-            if re.match(r'^UC[a-zA-Z0-9_-]{22}$', url_or_input):
+            if CHANNEL_ID_PATTERN.match(url_or_input):
                 return url_or_input, None
             
-            # 채널 URL에서 ID 추출
-            patterns = [
-                r'youtube\.com/channel/([UC][a-zA-Z0-9_-]{22})',
-                r'youtube\.com/c/([a-zA-Z0-9_-]+)',
-                r'youtube\.com/user/([a-zA-Z0-9_-]+)',
-                r'youtube\.com/@([a-zA-Z0-9_-]+)',
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, url_or_input)
-                if match:
-                    identifier = match.group(1)
-                    
-                    # UC로 시작하는 경우 채널 ID
-                    if identifier.startswith('UC'):
-                        return identifier, None
-                    else:
-                        # 핸들이나 사용자명인 경우 채널 ID로 변환 필요
-                        return self.resolve_channel_handle(identifier)
+            # 채널 URL에서 ID 추출 (모든 URL 형식을 한 번에 검색)
+            match = CHANNEL_URL_PATTERN.search(url_or_input)
+            if match:
+                identifier = match.group(match.lastgroup)
+                
+                # UC로 시작하는 경우 채널 ID
+                if identifier.startswith('UC'):
+                    return identifier, None
+                else:
+                    # 핸들이나 사용자명인 경우 채널 ID로 변환 필요
+                    return self.resolve_channel_handle(identifier)
             
             # 직접 핸들명인 경우
             return self.resolve_channel_handle(url_or_input)
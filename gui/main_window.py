@@ -8,12 +8,25 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 import threading
 
+from .background import CancellableThreadPoolExecutor
+from .channel_detail_window import shutdown_io_executor
+
+# 검색/채널 분석 작업 스레드 수
+BACKGROUND_TASK_WORKERS = 2
+
 class MainWindow:
     """메인 애플리케이션 창"""
     
     def __init__(self):
         """메인 창 초기화"""
         self.root = tk.Tk()
+        
+        # 탭의 검색/분석 작업을 실행할 공용 스레드 풀 (클릭마다 스레드를 만들지 않음)
+        self.task_executor = CancellableThreadPoolExecutor(
+            max_workers=BACKGROUND_TASK_WORKERS,
+            thread_name_prefix='analysis'
+        )
+        
         self.setup_window()
         self.create_menu()
         self.create_layout()
@@ -478,7 +491,9 @@ class MainWindow:
     def clear_cache(self):
         """캐시 정리"""
         try:
-            # TODO: 캐시 정리 로직 구현
+            from utils.cache_manager import clear_json_cache
+            clear_json_cache()
+            
             self.update_status("캐시가 정리되었습니다.")
             messagebox.showinfo("완료", "캐시가 정리되었습니다.")
         except Exception as e:
@@ -568,7 +583,22 @@ GitHub: 프로젝트 저장소 URL
     
     def run(self):
         """애플리케이션 실행"""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self.shutdown_background_tasks()
+    
+    def shutdown_background_tasks(self):
+        """진행 중인 검색/분석을 중지하고 작업 스레드 풀 정리"""
+        # 실행 중인 작업은 중지 플래그를 보고 스스로 종료
+        if self.search_tab:
+            self.search_tab.search_generation += 1
+            self.search_tab.is_analyzing = False
+        if self.channel_tab:
+            self.channel_tab.is_analyzing = False
+        
+        self.task_executor.shutdown_now()
+        shutdown_io_executor()
     
     def quit(self):
         """애플리케이션 종료"""
@@ -576,6 +606,7 @@ GitHub: 프로젝트 저장소 URL
     
     def destroy(self):
         """애플리케이션 종료 및 정리"""
+        self.shutdown_background_tasks()
         self.root.destroy()
     
     # 탭 간 데이터 공유를 위한 메서드들
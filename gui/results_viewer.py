@@ -4,9 +4,114 @@
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import webbrowser
 from datetime import datetime
+from functools import partial
+from operator import itemgetter
+
+from exporters import ThumbnailDownloader, quick_excel_export
+from utils import parse_duration, truncate_string
+from .background import run_in_background, show_task_result, download_result_message, excel_result_message
+
+# 지연 삽입 시 한 번에 추가할 행 수
+ROW_BATCH_SIZE = 40
+
+# 썸네일 병렬 다운로드 워커 수
+THUMBNAIL_DOWNLOAD_WORKERS = 16
+
+# 결과 테이블 컬럼 너비 (모든 컬럼을 나열, 빠진 컬럼은 KeyError로 바로 드러남)
+RESULT_COLUMN_WIDTHS = {
+    'rank': 80,
+    'title': 300,
+    'channel': 150,
+    'views': 100,
+    'outlier_score': 100,
+    'engagement': 100,
+    'video_type': 80,
+    'duration': 80,
+    'upload_date': 80
+}
+
+# 여러 행을 한 번의 Tcl 호출로 삽입하는 스크립트 (행마다 Python↔Tcl 왕복하지 않음)
+BULK_INSERT_SCRIPT = (
+    '{tree rows} {'
+    'set ids {}; '
+    'foreach values $rows {lappend ids [$tree insert {} end -values $values]}; '
+    'return $ids}'
+)
+
+# 여러 컬럼 헤더 텍스트를 한 번의 Tcl 호출로 바꾸는 스크립트 (인자: 테이블, {컬럼 텍스트 ...})
+HEADING_TEXT_SCRIPT = (
+    '{tree headings} {'
+    'foreach {col text} $headings {$tree heading $col -text $text}}'
+)
+
+
+def insert_tree_rows(tree, rows):
+    """
+    Treeview 끝에 여러 행을 한 번에 삽입
+    
+    Args:
+        tree (ttk.Treeview): 대상 테이블
+        rows (list): 행 값 튜플 목록
+        
+    Returns:
+        tuple: 삽입된 아이템 ID (rows와 같은 순서)
+    """
+    if not rows:
+        return ()
+    
+    return tree.tk.splitlist(tree.tk.call('apply', BULK_INSERT_SCRIPT, tree._w, tuple(rows)))
+
+def build_result_row(video):
+    """
+    결과 테이블 행 값 생성 (Tk를 사용하지 않으므로 작업 스레드에서 미리 호출 가능)
+    
+    Args:
+        video (dict): 분석된 영상 데이터
+        
+    Returns:
+        tuple: 테이블 컬럼 순서의 행 값 (video['_row_values']에도 보관, 오류 시 None)
+    """
+    cached = video.get('_row_values')
+    if cached is not None:
+        return cached
+    
+    try:
+        snippet = video['snippet']
+        statistics = video['statistics']
+        analysis = video.get('analysis', {})
+        
+        # 데이터 준비
+        rank = analysis.get('rank', 0)
+        title = truncate_string(snippet.get('title', ''), 50)
+        channel = truncate_string(snippet.get('channelTitle', ''), 20)
+        view_count = video.get('view_count')
+        if view_count is None:
+            view_count = int(statistics.get('viewCount', 0))
+        views = f"{view_count:,}"
+        outlier_score = f"{analysis.get('outlier_score', 0):.1f}"
+        engagement = f"{analysis.get('engagement_rate', 0):.2f}%"
+        video_type = analysis.get('video_type', '일반')
+        
+        # 영상 길이 - parse_duration 결과 사용
+        duration = video.get('parsed_duration', '00:00')
+        
+        upload_date = snippet.get('publishedAt', '')[:10]
+        
+        values = (
+            rank, title, channel, views, outlier_score, 
+            engagement, video_type, duration, upload_date
+        )
+        
+        # 필터 변경 등으로 다시 그릴 때는 포맷팅 없이 재사용
+        video['_row_values'] = values
+        return values
+        
+    except Exception as e:
+        print(f"영상 행 생성 오류: {e}")
+        return None
 
 class ResultsViewer:
     """결과 뷰어 클래스"""
@@ -26,9 +131,25 @@ class ResultsViewer:
         self.current_videos = []
         self.current_settings = {}
         
+        # 필터용 열 (current_videos와 같은 순서의 소문자 제목 / 영상 유형)
+        self.filter_titles = []
+        self.filter_types = []
+        
         # 정렬 상태 추적
         self.sort_reverse = {}
         
+        # 마지막 정렬 결과 (같은 컬럼 재클릭 시 다시 정렬하지 않고 뒤집어 사용, 행이 바뀌면 무효화)
+        self._last_sort_col = None
+        self._last_sort_order = None
+        
+        # 행 데이터 캐시 (아이템 ID -> 표시 값 / 영상 데이터)
+        self.row_values = {}
+        self.row_videos = {}
+        
+        # 아직 테이블에 삽입하지 않은 영상 (스크롤 시 지연 삽입)
+        self.pending_videos = []
+        self._materialize_scheduled = False
+        
         self.create_layout()
         print("✅ 결과 뷰어 초기화 완료")
     
@@ -159,15 +280,16 @@ class ResultsViewer:
         table_container.pack(fill='both', expand=True, pady=(10, 0))
         
         # Treeview 생성
-        columns = (
+        self.columns = (
             'rank', 'title', 'channel', 'views', 'outlier_score', 
             'engagement', 'video_type', 'duration', 'upload_date'
         )
         
         self.tree = ttk.Treeview(
             table_container,
-            columns=columns,
+            columns=self.columns,
             show='headings',
+            selectmode='extended',
             height=15
         )
         
@@ -184,31 +306,28 @@ class ResultsViewer:
             'upload_date': '업로드일'
         }
         
+        # 정렬 방향 표시 시 현재 헤더 텍스트를 Tcl에서 다시 읽지 않도록 보관
+        self.headers = headers
+        
         for col, header in headers.items():
-            self.tree.heading(col, text=header, command=lambda c=col: self.sort_column(c))
+            self.tree.heading(col, text=header, command=partial(self.sort_column, col))
+            self.tree.column(col, width=RESULT_COLUMN_WIDTHS[col])
             self.sort_reverse[col] = False
-            
-            # 컬럼 너비 설정
-            if col == 'title':
-                self.tree.column(col, width=300)
-            elif col == 'channel':
-                self.tree.column(col, width=150)
-            elif col in ['views', 'outlier_score', 'engagement']:
-                self.tree.column(col, width=100)
-            else:
-                self.tree.column(col, width=80)
         
         # 더블클릭 이벤트 (YouTube 링크 열기)
         self.tree.bind('<Double-1>', self.on_video_double_click)
         
+        # 선택 변경 시 선택 정보 갱신 (선택 상태는 Treeview 자체 선택 사용)
+        self.tree.bind('<<TreeviewSelect>>', lambda e: self.update_selection_info())
+        
         # 스크롤바
-        scrollbar_v = ttk.Scrollbar(table_container, orient='vertical', command=self.tree.yview)
+        self.scrollbar_v = ttk.Scrollbar(table_container, orient='vertical', command=self.tree.yview)
         scrollbar_h = ttk.Scrollbar(table_container, orient='horizontal', command=self.tree.xview)
-        self.tree.configure(yscrollcommand=scrollbar_v.set, xscrollcommand=scrollbar_h.set)
+        self.tree.configure(yscrollcommand=self.on_tree_yscroll, xscrollcommand=scrollbar_h.set)
         
         # 그리드 레이아웃
         self.tree.grid(row=0, column=0, sticky='nsew')
-        scrollbar_v.grid(row=0, column=1, sticky='ns')
+        self.scrollbar_v.grid(row=0, column=1, sticky='ns')
         scrollbar_h.grid(row=1, column=0, sticky='ew')
         
         table_container.grid_rowconfigure(0, weight=1)
@@ -310,9 +429,10 @@ class ResultsViewer:
         self.download_btn.pack(side='left')
         
         # 선택 정보
+        self.selection_text_var = tk.StringVar(value="선택된 영상: 0개")
         self.selection_label = tk.Label(
             action_frame,
-            text="선택된 영상: 0개",
+            textvariable=self.selection_text_var,
             font=('SF Pro Display', 10),
             bg='#f5f5f7',
             fg='#86868b'
@@ -322,37 +442,60 @@ class ResultsViewer:
     def sort_column(self, col):
         """컬럼 기준으로 정렬"""
         try:
-            # 현재 데이터 가져오기
-            data = [(self.tree.set(child, col), child) for child in self.tree.get_children('')]
-            
-            # 정렬 (숫자 컬럼과 텍스트 컬럼 구분)
-            if col in ['rank', 'views', 'outlier_score', 'engagement']:
-                # 숫자 정렬
-                data.sort(key=lambda x: float(x[0].replace(',', '').replace('%', '') or 0), reverse=self.sort_reverse[col])
-            elif col == 'upload_date':
-                # 날짜 정렬
-                data.sort(key=lambda x: x[0], reverse=self.sort_reverse[col])
-            else:
-                # 텍스트 정렬
-                data.sort(key=lambda x: x[0].lower(), reverse=self.sort_reverse[col])
-            
-            # 정렬된 순서로 아이템 재배치
-            for index, (val, child) in enumerate(data):
-                self.tree.move(child, '', index)
+            # 남은 행 삽입과 전체 재배치 동안 테이블을 숨겨 행마다 다시 그리지 않도록 함
+            self.tree.grid_remove()
+            try:
+                # 정렬은 전체 행 기준이므로 남은 행을 모두 삽입
+                self.materialize_rows(len(self.pending_videos))
+                
+                if col == self._last_sort_col and self._last_sort_order is not None:
+                    # 같은 컬럼 재클릭은 방향만 바뀌므로 이전 정렬 결과를 뒤집어 사용
+                    ordered = self._last_sort_order[::-1]
+                else:
+                    children = self.tree.get_children('')
+                    
+                    # 정렬 (숫자 컬럼과 텍스트 컬럼 구분)
+                    if col in ['rank', 'views', 'outlier_score', 'engagement', 'duration']:
+                        # 숫자 정렬 (표시 문자열 대신 미리 계산된 숫자 값 사용, 반복문 안의 속성 조회를 지역 변수로 고정)
+                        sort_value = self.get_numeric_sort_value
+                        row_videos = self.row_videos
+                        data = [(sort_value(row_videos[child], col), child) for child in children]
+                        data.sort(key=itemgetter(0), reverse=self.sort_reverse[col])
+                    else:
+                        # 현재 데이터 가져오기 (Tcl 조회 없이 캐시된 행 값 사용)
+                        col_index = self.columns.index(col)
+                        row_values = self.row_values
+                        
+                        if col == 'upload_date':
+                            # 날짜 정렬 (YYYY-MM-DD 문자열 그대로 비교)
+                            data = [(str(row_values[child][col_index]), child) for child in children]
+                        else:
+                            # 텍스트 정렬 (소문자 키를 한 번만 만들어 둠)
+                            data = [(str(row_values[child][col_index]).lower(), child) for child in children]
+                        
+                        data.sort(key=itemgetter(0), reverse=self.sort_reverse[col])
+                    
+                    ordered = [child for _, child in data]
+                
+                self._last_sort_col = col
+                self._last_sort_order = ordered
+                
+                # 정렬된 순서로 아이템 재배치 (행마다 move 대신 한 번의 Tcl 호출)
+                self.tree.set_children('', *ordered)
+            finally:
+                self.tree.grid()
             
             # 정렬 방향 토글
             self.sort_reverse[col] = not self.sort_reverse[col]
             
-            # 헤더에 정렬 방향 표시
-            for column in self.tree['columns']:
-                current_heading = self.tree.heading(column)['text']
-                clean_heading = current_heading.replace(' ↑', '').replace(' ↓', '')
-                
+            # 헤더에 정렬 방향 표시 (모든 헤더를 한 번의 Tcl 호출로 갱신)
+            headings = []
+            for column, header in self.headers.items():
                 if column == col:
-                    arrow = ' ↓' if self.sort_reverse[col] else ' ↑'
-                    self.tree.heading(column, text=clean_heading + arrow)
-                else:
-                    self.tree.heading(column, text=clean_heading)
+                    header += ' ↓' if self.sort_reverse[col] else ' ↑'
+                headings.extend((column, header))
+            
+            self.tree.tk.call('apply', HEADING_TEXT_SCRIPT, self.tree._w, tuple(headings))
                     
         except Exception as e:
             print(f"정렬 오류: {e}")
@@ -364,24 +507,14 @@ class ResultsViewer:
             if not selection:
                 return
                 
-            item = self.tree.item(selection[0])
-            values = item['values']
+            # 아이템 ID로 영상 데이터 조회 (행 값 조회/제목 비교 없이)
+            video = self.row_videos.get(selection[0])
             
-            if not values:
+            if video:
+                video_id = video['id']
+                url = f"https://www.youtube.com/watch?v={video_id}"
+                webbrowser.open(url)
                 return
-                
-            # 현재 영상 데이터에서 실제 video_id 찾기
-            title = values[1]  # 제목
-            
-            # 현재 영상 목록에서 해당 제목의 영상 찾기
-            for video in self.current_videos:
-                video_title = video['snippet']['title']
-                # 제목이 잘린 경우를 고려하여 부분 매치
-                if title.replace('...', '') in video_title or video_title.startswith(title.replace('...', '')):
-                    video_id = video['id']
-                    url = f"https://www.youtube.com/watch?v={video_id}"
-                    webbrowser.open(url)
-                    return
                     
             # 찾지 못한 경우 오류 메시지
             messagebox.showwarning("경고", "해당 영상의 링크를 찾을 수 없습니다.")
@@ -398,22 +531,8 @@ class ResultsViewer:
                 messagebox.showwarning("경고", "분석할 영상을 선택해주세요.")
                 return
             
-            # 선택된 영상 정보 가져오기
-            item = self.tree.item(selection[0])
-            values = item['values']
-            
-            if not values:
-                return
-            
-            # 영상 제목으로 실제 영상 데이터 찾기
-            title = values[1]  # 제목
-            
-            selected_video = None
-            for video in self.current_videos:
-                video_title = video['snippet']['title']
-                if title.replace('...', '') in video_title or video_title.startswith(title.replace('...', '')):
-                    selected_video = video
-                    break
+            # 선택된 영상 정보 가져오기 (아이템 ID로 바로 조회)
+            selected_video = self.row_videos.get(selection[0])
             
             if not selected_video:
                 messagebox.showerror("오류", "선택된 영상 정보를 찾을 수 없습니다.")
@@ -460,25 +579,17 @@ class ResultsViewer:
         search_text = self.search_var.get().lower()
         type_filter = self.type_filter_var.get()
         
-        # 기존 데이터 삭제
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # 필터링된 영상들 표시 (미리 만든 열만 비교, 영상 데이터는 조회하지 않음)
+        videos = self.current_videos
+        filtered_videos = [
+            videos[i]
+            for i, (title, video_type) in enumerate(zip(self.filter_titles, self.filter_types))
+            # 검색어 필터 / 유형 필터
+            if (not search_text or search_text in title)
+            and (type_filter == "전체" or type_filter == video_type)
+        ]
         
-        # 필터링된 영상들 표시
-        for video in self.current_videos:
-            title = video['snippet']['title'].lower()
-            video_type = video.get('analysis', {}).get('video_type', '일반')
-            
-            # 검색어 필터
-            if search_text and search_text not in title:
-                continue
-            
-            # 유형 필터
-            if type_filter != "전체" and type_filter != video_type:
-                continue
-            
-            # 조건을 만족하는 영상 추가
-            self.insert_video_row(video)
+        self.rebuild_rows(filtered_videos)
         
         self.update_selection_info()
 
@@ -488,6 +599,10 @@ class ResultsViewer:
             self.current_videos = videos_data
             self.current_settings = analysis_settings
             
+            # 필터 입력마다 반복하지 않도록 비교용 열을 한 번만 생성
+            self.filter_titles = [video['snippet']['title'].lower() for video in videos_data]
+            self.filter_types = [video.get('analysis', {}).get('video_type', '일반') for video in videos_data]
+            
             # 요약 정보 업데이트
             self.update_summary_info()
             
@@ -542,9 +657,7 @@ class ResultsViewer:
                 from collections import Counter
                 keyword_counts = Counter(all_keywords)
                 top_keywords = [kw for kw, _ in keyword_counts.most_common(5)]
-                keywords_text = ', '.join(top_keywords)
-                if len(keywords_text) > 50:
-                    keywords_text = keywords_text[:50] + "..."
+                keywords_text = truncate_string(', '.join(top_keywords), 50)
                 self.summary_labels['keywords'].config(text=keywords_text)
             else:
                 self.summary_labels['keywords'].config(text="키워드 없음")
@@ -558,16 +671,7 @@ class ResultsViewer:
     def update_table(self):
         """테이블 업데이트"""
         try:
-            # 기존 데이터 삭제
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-            
-            if not self.current_videos:
-                return
-            
-            # 데이터 삽입
-            for video in self.current_videos:
-                self.insert_video_row(video)
+            self.rebuild_rows(self.current_videos)
             
             # 선택 정보 업데이트
             self.update_selection_info()
@@ -575,38 +679,125 @@ class ResultsViewer:
         except Exception as e:
             print(f"테이블 업데이트 오류: {e}")
 
-    def insert_video_row(self, video):
-        """영상 행 삽입 - 길이 정보 수정"""
+    def get_numeric_sort_value(self, video, col):
+        """숫자 컬럼 정렬 값 (영상 데이터에 미리 계산된 필드 사용)"""
+        if col == 'views':
+            view_count = video.get('view_count')
+            if view_count is None:
+                view_count = int(video.get('statistics', {}).get('viewCount', 0))
+            return view_count
+        
+        if col == 'duration':
+            # 표시 문자열(1:02:03)은 문자열 순서와 길이 순서가 다르므로 초 단위 값 사용
+            duration_seconds = video.get('duration_seconds')
+            if duration_seconds is None:
+                duration_seconds = parse_duration(video.get('parsed_duration', '00:00'))
+            return duration_seconds
+        
+        analysis = video.get('analysis', {})
+        if col == 'rank':
+            return analysis.get('rank', 0)
+        if col == 'outlier_score':
+            return analysis.get('outlier_score', 0)
+        return analysis.get('engagement_rate', 0)
+    
+    def build_row_values(self, video):
+        """영상 한 개의 테이블 행 값 생성 (Tk 호출 없음, 결과는 영상 데이터에 보관)"""
+        return build_result_row(video)
+    
+    def rebuild_rows(self, videos):
+        """테이블 전체 다시 채우기 (삽입 동안 테이블을 숨겨 한 번만 다시 그림)"""
+        self.tree.grid_remove()
         try:
-            snippet = video['snippet']
-            statistics = video['statistics']
-            analysis = video.get('analysis', {})
-            
-            # 데이터 준비
-            rank = analysis.get('rank', 0)
-            title = snippet.get('title', '')[:50] + "..." if len(snippet.get('title', '')) > 50 else snippet.get('title', '')
-            channel = snippet.get('channelTitle', '')[:20] + "..." if len(snippet.get('channelTitle', '')) > 20 else snippet.get('channelTitle', '')
-            views = self.format_number(int(statistics.get('viewCount', 0)))
-            outlier_score = f"{analysis.get('outlier_score', 0):.1f}"
-            engagement = f"{analysis.get('engagement_rate', 0):.2f}%"
-            video_type = analysis.get('video_type', '일반')
-            
-            # 영상 길이 - parse_duration 결과 사용
-            duration = video.get('parsed_duration', '00:00')
-            
-            upload_date = snippet.get('publishedAt', '')[:10]
-            
-            # 테이블에 삽입
-            item_id = self.tree.insert('', 'end', values=(
-                rank, title, channel, views, outlier_score, 
-                engagement, video_type, duration, upload_date
-            ))
-            
-            # 영상 데이터를 아이템에 연결 (추후 사용을 위해)
-            self.tree.set(item_id, 'video_data', video)
+            # 삽입된 행은 모두 row_values에 있으므로 비어 있으면 Tcl 조회 없이 건너뜀
+            existing = list(self.tree.get_children()) if self.row_values else []
+            
+            self.row_values.clear()
+            self.row_videos.clear()
+            self.pending_videos = list(videos)
+            self._last_sort_col = None
+            self._last_sort_order = None
+            
+            # 기존 행은 첫 묶음 크기만큼 값만 바꿔 재사용하고 나머지는 한 번에 삭제
+            reuse_items = existing[:min(ROW_BATCH_SIZE, len(self.pending_videos))]
+            stale_items = existing[len(reuse_items):]
+            
+            if stale_items:
+                self.tree.delete(*stale_items)
+            
+            if reuse_items:
+                # 재사용 행에 이전 선택/스크롤 위치가 남지 않도록 초기화
+                self.tree.selection_set(())
+                self.tree.yview_moveto(0)
+                self.reuse_rows(reuse_items)
+            
+            # 첫 묶음의 남은 부분만 삽입하고 나머지는 스크롤 시 삽입
+            self.materialize_rows(ROW_BATCH_SIZE - len(reuse_items))
+        finally:
+            self.tree.grid()
+    
+    def reuse_rows(self, item_ids):
+        """기존 테이블 행에 대기 중인 영상 값을 순서대로 덮어쓰기"""
+        batch = self.pending_videos[:len(item_ids)]
+        del self.pending_videos[:len(item_ids)]
+        
+        build = self.build_row_values
+        set_item = self.tree.item
+        row_values = self.row_values
+        row_videos = self.row_videos
+        unused_items = []
+        
+        for item_id, video in zip(item_ids, batch):
+            values = build(video)
+            if values is None:
+                unused_items.append(item_id)
+                continue
             
-        except Exception as e:
-            print(f"영상 행 삽입 오류: {e}")
+            set_item(item_id, values=values)
+            row_values[item_id] = values
+            row_videos[item_id] = video
+        
+        if unused_items:
+            self.tree.delete(*unused_items)
+    
+    def materialize_rows(self, count=ROW_BATCH_SIZE):
+        """대기 중인 영상 중 count개를 테이블에 삽입"""
+        self._materialize_scheduled = False
+        
+        if not self.pending_videos:
+            return
+        
+        batch = self.pending_videos[:count]
+        del self.pending_videos[:count]
+        
+        # 새 행이 추가되므로 이전 정렬 결과는 더 이상 유효하지 않음
+        self._last_sort_col = None
+        self._last_sort_order = None
+        
+        # 행 값을 먼저 모두 만든 뒤 한 번의 Tcl 호출로 삽입
+        build = self.build_row_values
+        rows = []
+        for video in batch:
+            values = build(video)
+            if values is not None:
+                rows.append((video, values))
+        
+        item_ids = insert_tree_rows(self.tree, [values for _, values in rows])
+        
+        # 행 값과 영상 데이터를 아이템 ID로 캐시 (추후 Tcl 조회 없이 사용)
+        row_values = self.row_values
+        row_videos = self.row_videos
+        for item_id, (video, values) in zip(item_ids, rows):
+            row_values[item_id] = values
+            row_videos[item_id] = video
+    
+    def on_tree_yscroll(self, first, last):
+        """세로 스크롤 시 목록 끝에 가까워지면 다음 묶음 삽입"""
+        self.scrollbar_v.set(first, last)
+        
+        if self.pending_videos and not self._materialize_scheduled and float(last) >= 0.7:
+            self._materialize_scheduled = True
+            self.tree.after_idle(self.materialize_rows)
 
     def format_number(self, number):
         """숫자 포맷팅 (천 단위 구분)"""
@@ -618,8 +809,9 @@ class ResultsViewer:
     def update_selection_info(self):
         """선택 정보 업데이트"""
         try:
-            total_items = len(self.tree.get_children())
-            self.selection_label.config(text=f"총 영상: {total_items}개")
+            total_items = len(self.row_values) + len(self.pending_videos)
+            selected_items = len(self.tree.selection())
+            self.selection_text_var.set(f"총 영상: {total_items}개 / 선택된 영상: {selected_items}개")
         except Exception as e:
             print(f"선택 정보 업데이트 오류: {e}")
 
@@ -630,26 +822,103 @@ class ResultsViewer:
                 messagebox.showwarning("경고", "내보낼 데이터가 없습니다.")
                 return
             
-            # TODO: 엑셀 내보내기 구현
-            messagebox.showinfo("내보내기", "엑셀 내보내기 기능을 구현중입니다.")
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = filedialog.asksaveasfilename(
+                title="엑셀 파일 저장",
+                defaultextension=".xlsx",
+                initialfile=f"YouTube_Analysis_{timestamp}.xlsx",
+                filetypes=[("Excel 파일", "*.xlsx")]
+            )
+            if not filename:
+                return
+            
+            self.export_btn.config(state='disabled')
+            self.main_window.update_status(f"📊 {len(self.current_videos)}개 영상 엑셀 저장 중...")
+            
+            # 시트 생성/썸네일 삽입은 오래 걸리므로 작업 스레드 풀에서 처리
+            run_in_background(
+                self.main_window.task_executor,
+                self.parent,
+                partial(self._export_excel_worker, list(self.current_videos), dict(self.current_settings), filename),
+                self._on_excel_exported
+            )
             
         except Exception as e:
             print(f"엑셀 내보내기 오류: {e}")
             messagebox.showerror("오류", "엑셀 내보내기 중 오류가 발생했습니다.")
+    
+    def _export_excel_worker(self, videos, settings, filename):
+        """엑셀 파일 생성 (백그라운드 스레드)"""
+        return {'success': True, 'filename': quick_excel_export(videos, settings, filename)}
+    
+    def _on_excel_exported(self, result):
+        """엑셀 내보내기 완료 처리 (UI 스레드)"""
+        self.export_btn.config(state='normal')
+        show_task_result(result, "엑셀 내보내기", self.main_window.update_status, excel_result_message)
 
     def download_thumbnails(self):
-        """썸네일 다운로드"""
+        """썸네일 다운로드 (선택된 영상, 선택이 없으면 전체)"""
         try:
             if not self.current_videos:
                 messagebox.showwarning("경고", "다운로드할 데이터가 없습니다.")
                 return
             
-            # TODO: 썸네일 다운로드 구현
-            messagebox.showinfo("다운로드", "썸네일 다운로드 기능을 구현중입니다.")
+            selection = self.tree.selection()
+            if selection:
+                videos = [self.row_videos[item] for item in selection]
+            else:
+                videos = list(self.current_videos)
+            
+            output_dir = filedialog.askdirectory(title="썸네일 저장 폴더 선택")
+            if not output_dir:
+                return
+            
+            self.download_btn.config(state='disabled')
+            self.main_window.update_status(f"🖼️ {len(videos)}개 썸네일 다운로드 중...")
+            
+            # 네트워크 작업은 메인 창의 작업 스레드 풀에서 병렬 다운로더로 처리
+            run_in_background(
+                self.main_window.task_executor,
+                self.parent,
+                partial(self._download_thumbnails_worker, videos, output_dir),
+                partial(self._on_thumbnails_downloaded, output_dir=output_dir)
+            )
             
         except Exception as e:
             print(f"썸네일 다운로드 오류: {e}")
             messagebox.showerror("오류", "썸네일 다운로드 중 오류가 발생했습니다.")
+    
+    def _download_thumbnails_worker(self, videos, output_dir):
+        """썸네일 병렬 다운로드 (백그라운드 스레드)"""
+        # 검색에 사용한 클라이언트의 HTTP 세션이 있으면 연결 풀 공유
+        search_tab = getattr(self.main_window, 'search_tab', None)
+        youtube_client = getattr(search_tab, 'youtube_client', None)
+        session = getattr(youtube_client, 'session', None)
+        
+        downloader = ThumbnailDownloader(
+            output_dir,
+            max_workers=THUMBNAIL_DOWNLOAD_WORKERS,
+            session=session
+        )
+        return downloader.download_multiple_thumbnails(
+            videos,
+            create_zip=False,
+            progress_callback=self._report_thumbnail_progress
+        )
+    
+    def _report_thumbnail_progress(self, done, total):
+        """썸네일 다운로드 진행 상황을 상태바에 표시 (작업 스레드에서 호출)"""
+        self.parent.after(0, self.main_window.update_status, f"🖼️ 썸네일 다운로드 중... ({done}/{total} 완료)")
+    
+    def _on_thumbnails_downloaded(self, result, output_dir):
+        """썸네일 다운로드 완료 처리 (UI 스레드)"""
+        self.download_btn.config(state='normal')
+        show_task_result(
+            result,
+            "썸네일 다운로드",
+            self.main_window.update_status,
+            download_result_message("썸네일", output_dir)
+        )
 
     def display_channel_analysis(self, channel_data):
         """채널 분석 결과 표시"""
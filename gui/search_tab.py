@@ -5,7 +5,6 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import threading
 from datetime import datetime
 import re
 
@@ -13,8 +12,18 @@ import re
 from core import VideoSearcher, YouTubeClient
 from data import create_analysis_suite
 from exporters import quick_excel_export, quick_thumbnail_download
+from utils import SYMBOL_PATTERN
+from .background import ThrottledProgressMixin
 
-class SearchTab:
+# 숫자 입력창에서 숫자 이외 문자 제거용 패턴
+NON_DIGIT_PATTERN = re.compile(r'[^\d]')
+
+def parse_number_input(text):
+    """쉼표가 포함된 숫자 입력을 정수로 변환 (빈 값이면 None)"""
+    digits = NON_DIGIT_PATTERN.sub('', text)
+    return int(digits) if digits else None
+
+class SearchTab(ThrottledProgressMixin):
     """영상 검색 탭 클래스"""
     
     def __init__(self, parent, main_window):
@@ -30,8 +39,11 @@ class SearchTab:
         
         # 분석 상태
         self.is_analyzing = False
+        self.search_generation = 0  # 검색 세대 (중지/재검색 시 이전 결과 무시용)
+        self.current_future = None
         self.current_videos = []
         self.analysis_settings = {}
+        self._init_progress_state()
         
         # YouTube 클라이언트
         self.youtube_client = None
@@ -286,7 +298,7 @@ class SearchTab:
                         cursor_pos = entry.index(tk.INSERT)
                         
                         # 숫자만 추출
-                        numbers_only = re.sub(r'[^\d]', '', var.get())
+                        numbers_only = NON_DIGIT_PATTERN.sub('', var.get())
                         
                         if numbers_only:
                             # 자릿수 구분 적용
@@ -361,9 +373,11 @@ class SearchTab:
         )
         self.progress_bar.pack(fill='x', pady=(0, 5))
         
+        # 진행 문구는 StringVar로 연결 (갱신 시 위젯 재설정 없이 변수만 변경)
+        self.progress_text_var = tk.StringVar(value="준비 완료")
         self.progress_label = tk.Label(
             progress_frame,
-            text="준비 완료",
+            textvariable=self.progress_text_var,
             font=('SF Pro Display', 10),
             bg='#f5f5f7',
             fg='#86868b'
@@ -373,14 +387,9 @@ class SearchTab:
     def get_filter_values(self):
         """필터 값들을 숫자로 변환하여 반환"""
         try:
-            # 쉼표 제거 후 숫자 변환
-            min_views = None
-            if self.min_views_var.get().strip():
-                min_views = int(self.min_views_var.get().replace(',', ''))
-                
-            max_subs = None
-            if self.max_subs_var.get().strip():
-                max_subs = int(self.max_subs_var.get().replace(',', ''))
+            # 쉼표 제거 후 숫자 변환 (빈 값이면 제한 없음)
+            min_views = parse_number_input(self.min_views_var.get())
+            max_subs = parse_number_input(self.max_subs_var.get())
                 
             period_days = int(self.period_var.get()) if self.period_var.get() else 30
             max_results = int(self.max_results_var.get()) if self.max_results_var.get() else 200
@@ -416,107 +425,132 @@ class SearchTab:
         self.stop_btn.config(state='normal')
         self.update_progress(0, "검색 준비 중...")
         
-        # 백그라운드에서 검색 실행
-        search_thread = threading.Thread(
-            target=self.execute_search,
-            args=(filters,),
-            daemon=True
+        # 새 검색 세대 시작
+        self.search_generation += 1
+        
+        # 메인 창의 작업 스레드 풀에서 검색 실행
+        self.current_future = self.main_window.task_executor.submit(
+            self.execute_search, filters, self.search_generation
         )
-        search_thread.start()
     
-    def execute_search(self, filters):
-        """실제 검색 실행"""
+    def execute_search(self, filters, generation):
+        """실제 검색 실행 (generation이 바뀌면 중단하고 결과를 버림)"""
+        def is_stopped():
+            return generation != self.search_generation
+        
         try:
             # YouTube 클라이언트 초기화
             api_key = self.main_window.get_api_key()
             if not api_key:
-                self.handle_search_error("API 키가 설정되지 않았습니다.")
+                self._report_search_error("API 키가 설정되지 않았습니다.", generation)
                 return
             
-            self.youtube_client = YouTubeClient(api_key)
-            self.video_searcher = VideoSearcher(self.youtube_client)
+            # 클라이언트는 API 키가 바뀔 때만 새로 생성 (API/썸네일 연결 재사용)
+            if not self.youtube_client or self.youtube_client.api_key != api_key:
+                self.youtube_client = YouTubeClient(api_key)
+                self.video_searcher = VideoSearcher(self.youtube_client)
             
+            if is_stopped():
+                return
             self.update_progress(10, "영상 검색 중...")
             
-            # 영상 검색
-            videos = self.video_searcher.search_with_filters(filters['keyword'], filters)
+            # 영상 검색 (중지되면 다음 페이지/필터 단계의 API 요청을 하지 않음)
+            videos = self.video_searcher.search_with_filters(filters['keyword'], filters, should_stop=is_stopped)
             
+            if is_stopped():
+                return
             if not videos:
-                self.handle_search_error("검색 결과가 없습니다.")
+                self._report_search_error("검색 결과가 없습니다.", generation)
                 return
             
             self.update_progress(50, f"{len(videos)}개 영상 분석 중...")
             
-            # 분석 수행
+            # 결과 뷰어는 지연 로딩되므로 행 포맷 함수도 여기서 가져옴
+            from .results_viewer import build_result_row
+            
+            # 참여율/유형은 영상 목록 전체를 한 번에 계산
+            batch_metrics = self.analysis_suite['engagement_calculator'].calculate_batch_metrics(videos)
+            
+            # 분석 수행 (반복문 안의 메서드 조회를 지역 변수로 고정)
             analyzed_videos = []
-            for i, video in enumerate(videos):
-                if not self.is_analyzing:  # 중지 체크
-                    break
+            analyze = self.analyze_single_video
+            update_progress = self.update_progress
+            add_video = analyzed_videos.append
+            total = len(videos)
+            
+            for i, (video, metrics) in enumerate(zip(videos, batch_metrics)):
+                if is_stopped():  # 중지 체크
+                    return
                 
                 # 간단한 분석 수행
-                analysis = self.analyze_single_video(video, i + 1)
-                video['analysis'] = analysis
-                analyzed_videos.append(video)
+                video['analysis'] = analyze(video, i + 1, metrics)
+                
+                # 테이블 행 문자열도 작업 스레드에서 미리 만들어 둠 (UI 스레드는 삽입만 수행)
+                build_result_row(video)
+                add_video(video)
                 
                 # 진행률 업데이트
-                progress = 50 + (i / len(videos)) * 40
-                self.update_progress(progress, f"분석 중... ({i+1}/{len(videos)})")
+                progress = 50 + (i / total) * 40
+                update_progress(progress, f"분석 중... ({i+1}/{total})", throttle=True)
             
-            if self.is_analyzing:
-                self.current_videos = analyzed_videos
-                self.analysis_settings = filters
-                
-                self.update_progress(100, f"완료! {len(analyzed_videos)}개 영상 분석됨")
-                
-                # 결과 표시
-                self.show_results_in_viewer(analyzed_videos, filters)
+            if is_stopped():
+                return
+            
+            self.current_videos = analyzed_videos
+            self.analysis_settings = filters
+            
+            self.update_progress(100, f"완료! {len(analyzed_videos)}개 영상 분석됨")
+            
+            # 결과 표시 (UI 스레드에서, 그 사이 중지되었으면 건너뜀)
+            self.parent.after(0, self.show_results_in_viewer, analyzed_videos, filters, generation)
             
         except Exception as e:
-            self.handle_search_error(str(e))
+            self._report_search_error(str(e), generation)
         finally:
-            # UI 상태 복원
-            self.is_analyzing = False
-            self.search_btn.config(state='normal')
-            self.stop_btn.config(state='disabled')
+            # 작업 스레드가 끝난 뒤에만 다음 검색을 허용 (같은 클라이언트/캐시를 동시에 쓰지 않도록)
+            self.parent.after(0, self._finish_search, generation)
+    
+    def _report_search_error(self, error, generation):
+        """작업 스레드의 오류를 UI 스레드에서 표시 (중지된 검색이면 무시)"""
+        def show():
+            if generation == self.search_generation:
+                self.handle_search_error(error)
+        
+        self.parent.after(0, show)
+    
+    def _finish_search(self, generation):
+        """검색 작업 종료 후 UI 상태 복원 (UI 스레드)"""
+        self.is_analyzing = False
+        self.current_future = None
+        self.search_btn.config(state='normal')
+        self.stop_btn.config(state='disabled')
+        
+        if generation != self.search_generation:
+            self.update_progress(0, "중지됨")
     
-    def analyze_single_video(self, video, rank):
-        """개별 영상 분석"""
+    def analyze_single_video(self, video, rank, metrics):
+        """개별 영상 분석 (참여율/유형은 calculate_batch_metrics 결과 사용)"""
         try:
             snippet = video['snippet']
-            statistics = video['statistics']
             
             # 기본 정보 추출
             title = snippet.get('title', '')
-            views = int(statistics.get('viewCount', 0))
-            likes = int(statistics.get('likeCount', 0))
-            comments = int(statistics.get('commentCount', 0))
             
             # 간단한 키워드 추출
             keywords = []
             if title:
                 # 특수문자 제거 후 단어 분리
-                clean_title = re.sub(r'[^\w\s가-힣]', ' ', title)
+                clean_title = SYMBOL_PATTERN.sub(' ', title)
                 words = [word for word in clean_title.split() if len(word) >= 2]
                 keywords = words[:5]  # 상위 5개 단어
             
-            # 참여도 계산
-            engagement_rate = 0
-            if views > 0:
-                engagement_rate = ((likes + comments) / views) * 100
-            
-            # 아웃라이어 점수 (간단한 계산)
-            outlier_score = min(engagement_rate * 10, 100)
-            
-            # 영상 유형 판별
-            duration = video.get('parsed_duration', '00:00')
-            video_type = '쇼츠' if ':' in duration and int(duration.split(':')[0]) == 0 and int(duration.split(':')[1]) <= 1 else '롱폼'
-            
             return {
                 'rank': rank,
                 'keywords': keywords,
-                'engagement_rate': engagement_rate,
-                'outlier_score': outlier_score,
-                'video_type': video_type
+                'engagement_rate': metrics['engagement_rate'],
+                'outlier_score': metrics['outlier_score'],
+                'views_per_day': metrics['views_per_day'],
+                'video_type': metrics['video_type']
             }
             
         except Exception as e:
@@ -529,17 +563,19 @@ class SearchTab:
                 'video_type': '일반'
             }
     
-    def update_progress(self, value, text):
-        """진행률 업데이트"""
-        self.progress_var.set(value)
-        self.progress_label.config(text=text)
-        self.parent.update_idletasks()
-    
     def stop_search(self):
         """검색 중지"""
-        self.is_analyzing = False
-        self.update_progress(0, "중지됨")
+        # 진행 중인 검색의 세대를 무효화 (작업 스레드는 다음 확인 지점에서 종료)
+        self.search_generation += 1
+        self.stop_btn.config(state='disabled')
         print("🛑 사용자에 의해 검색이 중지되었습니다.")
+        
+        if self.current_future and self.current_future.cancel():
+            # 아직 시작 전이라 실행이 취소된 경우 바로 UI 복원
+            self._finish_search(None)
+        else:
+            # 실행 중인 작업이 끝나면 _finish_search에서 검색 버튼을 다시 활성화
+            self.update_progress(0, "중지하는 중...")
 
     def handle_search_error(self, error):
         """검색 오류 처리"""
@@ -559,8 +595,11 @@ class SearchTab:
         messagebox.showerror("검색 오류", user_msg)
         self.update_progress(0, "오류 발생")
 
-    def show_results_in_viewer(self, videos_data, analysis_settings):
-        """결과 뷰어에 결과 표시"""
+    def show_results_in_viewer(self, videos_data, analysis_settings, generation=None):
+        """결과 뷰어에 결과 표시 (이전 세대 결과는 무시)"""
+        if generation is not None and generation != self.search_generation:
+            return
+        
         try:
             # 결과 탭 로드 (아직 로드되지 않은 경우)
             self.main_window.load_results_tab()
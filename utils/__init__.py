@@ -6,18 +6,24 @@ utils/__init__.py
 # 현재 사용 가능한 모듈만 import
 try:
     from .formatters import (
-        format_number, format_duration, format_datetime, 
+        format_number, format_duration, format_seconds, parse_duration_seconds, format_datetime, 
         format_file_size, format_percentage, format_views_short,
-        format_outlier_score, clean_filename
+        format_outlier_score, clean_filename, SYMBOL_PATTERN
     )
     FORMATTERS_AVAILABLE = True
 except ImportError:
     FORMATTERS_AVAILABLE = False
     print("⚠️ formatters 모듈을 로드할 수 없습니다.")
 
+try:
+    from .cache_manager import load_json_cache, save_json_cache, clear_json_cache
+    CACHE_MANAGER_AVAILABLE = True
+except ImportError:
+    CACHE_MANAGER_AVAILABLE = False
+    print("⚠️ cache_manager 모듈을 로드할 수 없습니다.")
+
 # 다른 모듈들은 차차 구현 예정
 VALIDATORS_AVAILABLE = False
-CACHE_MANAGER_AVAILABLE = False
 ERROR_HANDLER_AVAILABLE = False
 
 __version__ = "3.0.0"
@@ -27,11 +33,14 @@ __all__ = []
 
 if FORMATTERS_AVAILABLE:
     __all__.extend([
-        'format_number', 'format_duration', 'format_datetime',
+        'format_number', 'format_duration', 'format_seconds', 'parse_duration_seconds', 'format_datetime',
         'format_file_size', 'format_percentage', 'format_views_short',
-        'format_outlier_score', 'clean_filename'
+        'format_outlier_score', 'clean_filename', 'SYMBOL_PATTERN'
     ])
 
+if CACHE_MANAGER_AVAILABLE:
+    __all__.extend(['load_json_cache', 'save_json_cache', 'clear_json_cache'])
+
 # 기본 유틸리티 함수들 (내장)
 def safe_int(value, default=0):
     """안전한 정수 변환"""
@@ -65,29 +74,8 @@ def truncate_string(text, max_length=50, suffix="..."):
     return text[:max_length - len(suffix)] + suffix
 
 def parse_duration(duration_str):
-    """YouTube 영상 길이 파싱 (초 단위로 변환)"""
-    import re
-    
-    if not duration_str:
-        return 0
-    
-    # ISO 8601 duration (PT4M13S) 형태 처리
-    if duration_str.startswith('PT'):
-        pattern = r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?'
-    else:
-        # 이미 포맷된 형태 (4:13, 1:04:13)
-        pattern = r'(?:(\d+):)?(\d+):(\d+)'
-    
-    match = re.match(pattern, duration_str)
-    
-    if not match:
-        return 0
-    
-    hours = int(match.group(1) or 0)
-    minutes = int(match.group(2) or 0)
-    seconds = int(match.group(3) or 0)
-    
-    return hours * 3600 + minutes * 60 + seconds
+    """YouTube 영상 길이 파싱 (초 단위로 변환, 형식이 맞지 않으면 0)"""
+    return parse_duration_seconds(duration_str) or 0
 
 def extract_video_id_from_url(url):
     """YouTube URL에서 영상 ID 추출"""
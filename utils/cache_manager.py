@@ -0,0 +1,85 @@
+"""
+cache_manager.py
+API 응답 디스크 캐시 (JSON 파일 + TTL)
+"""
+
+import os
+import re
+import json
+import time
+import shutil
+import tempfile
+
+# 캐시 저장 위치
+CACHE_ROOT = os.path.join(os.path.expanduser('~'), '.cache', 'youtube_analyzer')
+
+
+def _cache_path(namespace, key):
+    """캐시 파일 경로 생성"""
+    safe_key = re.sub(r'[^\w\-]', '_', str(key))
+    return os.path.join(CACHE_ROOT, namespace, f"{safe_key}.json")
+
+
+def load_json_cache(namespace, key, ttl_seconds):
+    """
+    디스크 캐시에서 값 읽기
+    
+    Args:
+        namespace (str): 캐시 구분 (하위 디렉토리 이름)
+        key (str): 캐시 키 (채널 ID 등)
+        ttl_seconds (int): 유효 시간 (초)
+    
+    Returns:
+        저장된 값 (없거나 만료된 경우 None)
+    """
+    try:
+        with open(_cache_path(namespace, key), 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if time.time() - entry.get('ts', 0) > ttl_seconds:
+        return None
+    
+    return entry.get('data')
+
+
+def save_json_cache(namespace, key, data):
+    """
+    디스크 캐시에 값 저장 (임시 파일 작성 후 교체)
+    
+    Args:
+        namespace (str): 캐시 구분 (하위 디렉토리 이름)
+        key (str): 캐시 키
+        data: JSON으로 직렬화 가능한 값
+    
+    Returns:
+        bool: 저장 성공 여부
+    """
+    path = _cache_path(namespace, key)
+    
+    try:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'ts': time.time(), 'data': data}, f, ensure_ascii=False)
+        
+        os.replace(tmp_path, path)
+        return True
+    
+    except Exception as e:
+        print(f"⚠️ 캐시 저장 오류 ({namespace}/{key}): {e}")
+        return False
+
+
+def clear_json_cache(namespace=None):
+    """
+    디스크 캐시 삭제
+    
+    Args:
+        namespace (str): 삭제할 캐시 구분 (None이면 전체)
+    """
+    target = os.path.join(CACHE_ROOT, namespace) if namespace else CACHE_ROOT
+    shutil.rmtree(target, ignore_errors=True)
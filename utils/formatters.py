@@ -5,6 +5,14 @@ formatters.py
 
 import re
 from datetime import datetime
+from functools import lru_cache
+
+# YouTube 영상 길이 패턴 (ISO 8601 PT1H2M3S / 이미 포맷된 1:02:03)
+ISO_DURATION_PATTERN = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+CLOCK_DURATION_PATTERN = re.compile(r'(?:(\d+):)?(\d+):(\d+)')
+
+# 제목/키워드 정제 시 제거할 특수문자 패턴 (문자, 숫자, 공백, 한글 이외)
+SYMBOL_PATTERN = re.compile(r'[^\w\s가-힣]')
 
 
 def format_number(number):
@@ -21,31 +29,64 @@ def format_number(number):
 
 
 def format_duration(duration_str):
-    """YouTube 영상 길이를 사람이 읽기 쉬운 형태로 변환"""
+    """YouTube 영상 길이를 사람이 읽기 쉬운 형태로 변환 (ISO 8601 문자열 또는 초 단위 숫자)"""
     if not duration_str:
         return "0:00"
     
+    # 초 단위 숫자
+    if isinstance(duration_str, (int, float)):
+        return format_seconds(duration_str)
+    
     # ISO 8601 duration (PT4M13S) 형태 처리
     if duration_str.startswith('PT'):
-        pattern = r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?'
-        match = re.match(pattern, duration_str)
-        
-        if not match:
-            return "0:00"
-        
-        hours = int(match.group(1) or 0)
-        minutes = int(match.group(2) or 0)
-        seconds = int(match.group(3) or 0)
-        
-        if hours > 0:
-            return f"{hours}:{minutes:02d}:{seconds:02d}"
-        else:
-            return f"{minutes}:{seconds:02d}"
+        return _format_iso_duration(duration_str)
     
     # 이미 포맷된 형태라면 그대로 반환
     return duration_str
 
 
+def _format_iso_duration(duration_str):
+    """ISO 8601 길이 문자열 포맷 (파싱/포맷 결과는 각각 캐시됨)"""
+    return format_seconds(parse_duration_seconds(duration_str) or 0)
+
+
+@lru_cache(maxsize=4096)
+def parse_duration_seconds(duration_str):
+    """
+    YouTube 영상 길이를 초 단위로 변환 (결과 캐시)
+    
+    Args:
+        duration_str (str): ISO 8601 형식의 길이 (PT1H2M3S) 또는 표시용 길이 (1:02:03)
+        
+    Returns:
+        int: 초 단위 길이 (형식이 맞지 않으면 None)
+    """
+    if not duration_str:
+        return None
+    
+    if duration_str.startswith('PT'):
+        match = ISO_DURATION_PATTERN.match(duration_str)
+    else:
+        match = CLOCK_DURATION_PATTERN.match(duration_str)
+    
+    if not match:
+        return None
+    
+    hours = int(match.group(1) or 0)
+    minutes = int(match.group(2) or 0)
+    seconds = int(match.group(3) or 0)
+    
+    return hours * 3600 + minutes * 60 + seconds
+
+
+@lru_cache(maxsize=4096)
+def format_seconds(total_seconds):
+    """초 단위 길이를 H:MM:SS 또는 M:SS 형태로 변환 (같은 길이가 반복되므로 결과 캐시)"""
+    minutes, seconds = divmod(int(total_seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+
 def format_datetime(dt, format_type='readable'):
     """날짜시간을 다양한 형태로 포맷"""
     if isinstance(dt, str):